@@ -17,17 +17,43 @@ Example addresses:
 
 import json
 from collections import Counter
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, Iterable, List
 
 
 BASE58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
 
+# O(1) membership test (a 58-char string scan is linear per lookup)
+_BASE58_SET = frozenset(BASE58_ALPHABET)
 
+
+def count_base58_chars(addresses: Iterable[str]) -> Counter:
+    """
+    Count Base58 character occurrences across any number of addresses
+
+    Addresses are consumed one at a time, so a generator over a large
+    corpus (e.g. lines of a file) never has to be held in memory. The
+    per-character counting runs inside Counter's C implementation.
+    """
+    char_counter = Counter()
+
+    for address in addresses:
+        char_counter.update(address)
+
+    for char in char_counter.keys() - _BASE58_SET:
+        del char_counter[char]
+
+    return char_counter
+
+
+@lru_cache(maxsize=1)
 def analyze_sample_addresses() -> Counter:
     """
     Analyze character frequency in sample Bitcoin addresses
 
     This uses known patterns and statistical analysis of real addresses
+
+    The result is cached, so callers share one Counter and must not mutate it.
     """
 
     # Sample of real Bitcoin addresses (publicly known addresses)
@@ -57,15 +83,7 @@ def analyze_sample_addresses() -> Counter:
         '1Dorian4RsruUgmdXpdPayZbZpcBhZxd9P',
     ]
 
-    # Count character occurrences
-    char_counter = Counter()
-
-    for address in sample_addresses:
-        for char in address:
-            if char in BASE58_ALPHABET:
-                char_counter[char] += 1
-
-    return char_counter
+    return count_base58_chars(sample_addresses)
 
 
 def create_optimal_mapping(candidates_file='data/top_candidates.json') -> Dict:
@@ -78,9 +96,9 @@ def create_optimal_mapping(candidates_file='data/top_candidates.json') -> Dict:
     3. Avoid confusable emoji for visually similar Base58 chars
     """
 
-    # Load top candidates
-    with open(candidates_file, 'r', encoding='utf-8') as f:
-        candidates = json.load(f)
+    # Load top candidates (read raw bytes in one call; json.loads detects UTF-8)
+    with open(candidates_file, 'rb') as f:
+        candidates = json.loads(f.read())
 
     # Get character frequency
     char_freq = analyze_sample_addresses()
@@ -100,10 +118,10 @@ def create_optimal_mapping(candidates_file='data/top_candidates.json') -> Dict:
     sorted_by_freq = [char for char, _ in char_freq.most_common() if char not in ['1', '3']]
     priority_mapping.extend(sorted_by_freq)
 
-    # Add any missing Base58 chars
-    for char in BASE58_ALPHABET:
-        if char not in priority_mapping:
-            priority_mapping.append(char)
+    # Add any missing Base58 chars (never observed in the sample),
+    # keeping alphabet order so the result is deterministic
+    have = set(priority_mapping)
+    priority_mapping.extend(char for char in BASE58_ALPHABET if char not in have)
 
     # Create mapping: most important char -> most distinct emoji
     mapping = {}
@@ -123,58 +141,60 @@ def create_optimal_mapping(candidates_file='data/top_candidates.json') -> Dict:
 def generate_mapping_report(mapping: Dict, priority_order: List[str]):
     """Generate detailed mapping report"""
 
-    print("=" * 80)
-    print("BASE58 -> EMOJI MAPPING PROPOSAL")
-    print("=" * 80)
-    print()
-    print("STRATEGY:")
-    print("  • Most common Base58 characters -> Most distinct emoji")
-    print("  • Address prefixes (1, 3) get highly recognizable emoji")
-    print("  • Optimized for copy-paste use cases")
-    print()
-    print("=" * 80)
-    print()
-
-    print("TOP 10 MOST IMPORTANT MAPPINGS:")
-    print("-" * 80)
-    print(f"{'Base58':<8} {'Emoji':<6} {'Name':<40} {'Score':<8}")
-    print("-" * 80)
+    # Collect the report and write it once rather than print per line
+    lines = []
+    out = lines.append
+
+    out("=" * 80)
+    out("BASE58 -> EMOJI MAPPING PROPOSAL")
+    out("=" * 80)
+    out("")
+    out("STRATEGY:")
+    out("  • Most common Base58 characters -> Most distinct emoji")
+    out("  • Address prefixes (1, 3) get highly recognizable emoji")
+    out("  • Optimized for copy-paste use cases")
+    out("")
+    out("=" * 80)
+    out("")
+
+    out("TOP 10 MOST IMPORTANT MAPPINGS:")
+    out("-" * 80)
+    out(f"{'Base58':<8} {'Emoji':<6} {'Name':<40} {'Score':<8}")
+    out("-" * 80)
 
     for i, char in enumerate(priority_order[:10]):
         if char in mapping:
             m = mapping[char]
-            print(f"{char:<8} {m['emoji']:<6} {m['name']:<40} {m['distinctiveness']:.3f}")
+            out(f"{char:<8} {m['emoji']:<6} {m['name']:<40} {m['distinctiveness']:.3f}")
 
-    print()
-    print("FULL MAPPING (58 characters):")
-    print("-" * 80)
-    print(f"{'Base58':<8} {'Emoji':<6} {'Name':<40} {'Score':<8}")
-    print("-" * 80)
+    out("")
+    out("FULL MAPPING (58 characters):")
+    out("-" * 80)
+    out(f"{'Base58':<8} {'Emoji':<6} {'Name':<40} {'Score':<8}")
+    out("-" * 80)
 
     for i, char in enumerate(priority_order[:58]):
         if char in mapping:
             m = mapping[char]
-            print(f"{char:<8} {m['emoji']:<6} {m['name']:<40} {m['distinctiveness']:.3f}")
+            out(f"{char:<8} {m['emoji']:<6} {m['name']:<40} {m['distinctiveness']:.3f}")
 
-    print()
-    print("=" * 80)
-    print("EXAMPLE ADDRESS ENCODING:")
-    print("=" * 80)
+    out("")
+    out("=" * 80)
+    out("EXAMPLE ADDRESS ENCODING:")
+    out("=" * 80)
 
     example_address = "1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa"
-    encoded_emoji = ""
+    encoded_emoji = ''.join(
+        [mapping[char]['emoji'] if char in mapping else "❓" for char in example_address]
+    )
 
-    for char in example_address:
-        if char in mapping:
-            encoded_emoji += mapping[char]['emoji']
-        else:
-            encoded_emoji += "❓"
+    out("")
+    out(f"Original:  {example_address}")
+    out(f"Emoji:     {encoded_emoji}")
+    out("")
+    out("=" * 80)
 
-    print()
-    print(f"Original:  {example_address}")
-    print(f"Emoji:     {encoded_emoji}")
-    print()
-    print("=" * 80)
+    print("\n".join(lines))
 
 
 def main():
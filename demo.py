@@ -5,9 +5,27 @@ BIP-😸 Interactive Demo
 Demonstrates the emoji codec with real Bitcoin addresses
 """
 
+import re
+
 from emoji_codec import EmojiCodec
 
 
+# Name keywords for each emoji category, checked in order (first match wins)
+CATEGORY_KEYWORDS = {
+    'people': ['face', 'person', 'man', 'woman', 'child', 'boy', 'girl', 'baby', 'beard', 'prince', 'princess', 'claus'],
+    'hands': ['hand', 'fist', 'finger', 'palm', 'clap'],
+    'food': ['fruit', 'apple', 'pear', 'peach', 'melon', 'kiwi', 'orange', 'tangerine', 'pepper', 'plant', 'tree', 'flower', 'leaf', 'blossom'],
+    'animals': ['animal', 'dog', 'cat', 'monkey', 'beetle', 'hedgehog', 'chick', 'oyster', 'ladybug'],
+}
+
+# One compiled alternation per category: a single search per name
+# instead of a substring scan per keyword
+_CATEGORY_PATTERNS = {
+    category: re.compile('|'.join(map(re.escape, words)))
+    for category, words in CATEGORY_KEYWORDS.items()
+}
+
+
 def print_header(title):
     """Print section header"""
     print()
@@ -91,8 +109,7 @@ def demo_visual_distinction():
     ]
 
     print("P2PKH Addresses (legacy, start with '1' → 🧔):")
-    for addr in p2pkh_addresses:
-        emoji_addr, _ = codec.encode(addr)
+    for addr, (emoji_addr, _) in zip(p2pkh_addresses, codec.encode_many(p2pkh_addresses)):
         print(f"   {emoji_addr[:10]}... ← {addr[:10]}...")
     print()
 
@@ -104,8 +121,7 @@ def demo_visual_distinction():
     ]
 
     print("P2SH Addresses (script, start with '3' → 🍊):")
-    for addr in p2sh_addresses:
-        emoji_addr, _ = codec.encode(addr)
+    for addr, (emoji_addr, _) in zip(p2sh_addresses, codec.encode_many(p2sh_addresses)):
         print(f"   {emoji_addr[:10]}... ← {addr[:10]}...")
     print()
 
@@ -130,7 +146,7 @@ def demo_character_mapping():
     print()
 
     print("Mapping breakdown:")
-    emoji_list = list(codec._split_emoji(emoji_address))
+    emoji_list = codec.encode_tokens(address)
 
     for i, char in enumerate(address):
         if i < len(emoji_list):
@@ -183,14 +199,10 @@ def demo_statistics():
     for base58_char, emoji_data in codec.mapping.items():
         name = emoji_data['name'].lower()
 
-        if any(word in name for word in ['face', 'person', 'man', 'woman', 'child', 'boy', 'girl', 'baby', 'beard', 'prince', 'princess', 'claus']):
-            categories['people'] += 1
-        elif any(word in name for word in ['hand', 'fist', 'finger', 'palm', 'clap']):
-            categories['hands'] += 1
-        elif any(word in name for word in ['fruit', 'apple', 'pear', 'peach', 'melon', 'kiwi', 'orange', 'tangerine', 'pepper', 'plant', 'tree', 'flower', 'leaf', 'blossom']):
-            categories['food'] += 1
-        elif any(word in name for word in ['animal', 'dog', 'cat', 'monkey', 'beetle', 'hedgehog', 'chick', 'oyster', 'ladybug']):
-            categories['animals'] += 1
+        for category, pattern in _CATEGORY_PATTERNS.items():
+            if pattern.search(name):
+                categories[category] += 1
+                break
         else:
             categories['objects'] += 1
 
@@ -9,6 +9,18 @@ using common emoji mapping.
 from emoji_codec import EmojiCodec
 
 
+# (start, end) slices used to split an encoded address across messages
+MESSAGE_CHUNK_OFFSETS = ((0, 5), (5, 13), (13, 23), (23, None))
+
+# Message templates, one per chunk
+MESSAGE_TEMPLATES = (
+    "Hey! {} How are you doing today?",
+    "That's great to hear! {} What are your plans for the weekend?",
+    "Sounds fun! {} Let me know if you want to hang out!",
+    "Talk to you later! {} Have a great day!",
+)
+
+
 def print_header(title):
     """Print section header"""
     print()
@@ -55,20 +67,10 @@ def demo_hiding_in_messages():
     emoji_addr, _ = codec.encode(address)
 
     # Split emoji into natural-looking chunks
-    chunks = [
-        emoji_addr[:5],
-        emoji_addr[5:13],
-        emoji_addr[13:23],
-        emoji_addr[23:],
-    ]
+    chunks = [emoji_addr[start:end] for start, end in MESSAGE_CHUNK_OFFSETS]
 
     # Create a natural-looking message
-    messages = [
-        f"Hey! {chunks[0]} How are you doing today?",
-        f"That's great to hear! {chunks[1]} What are your plans for the weekend?",
-        f"Sounds fun! {chunks[2]} Let me know if you want to hang out!",
-        f"Talk to you later! {chunks[3]} Have a great day!",
-    ]
+    messages = [template.format(chunk) for template, chunk in zip(MESSAGE_TEMPLATES, chunks)]
 
     print("CONVERSATION WITH HIDDEN ADDRESS:")
     print("-" * 80)
@@ -127,8 +129,9 @@ def demo_address_type_prefixes():
     print("Address prefixes use ultra-common emoji:")
     print()
 
-    for addr_type, addr in addresses:
-        emoji_addr, _ = codec.encode(addr)
+    encoded = codec.encode_many([addr for _, addr in addresses])
+
+    for (addr_type, addr), (emoji_addr, _) in zip(addresses, encoded):
         prefix_emoji = emoji_addr[:3]
         print(f"{addr_type}: {addr[:10]}... → {prefix_emoji}...")
 
@@ -7,8 +7,100 @@ Uses Twemoji (Twitter) as a starting point for prototyping
 import json
 import requests
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+TWEMOJI_BASE_URL = "https://cdn.jsdelivr.net/gh/twitter/twemoji@latest/assets"
+
+# Downloads are I/O-bound, so many more threads than cores is fine
+MAX_WORKERS = 32
+
+# Single-pass character substitutions for codepoints and filenames
+_CODEPOINT_TABLE = str.maketrans({' ': '-'})
+_NAME_TABLE = str.maketrans({'/': '-', ' ': '_'})
+
+
+def get_image_filename(emoji):
+    """
+    Build the Twemoji codepoint and local filename for an emoji
+
+    Returns:
+        (codepoint, filename)
+    """
+    # Convert codepoint to lowercase and handle multi-codepoint emoji
+    codepoint = emoji['codepoint'].translate(_CODEPOINT_TABLE).lower()
+
+    # Create safe filename
+    safe_name = emoji['name'].translate(_NAME_TABLE)
+    return codepoint, f"{codepoint}_{safe_name}.png"
+
+
+def twemoji_urls(codepoint, svg=False):
+    """
+    Twemoji CDN URLs to try for a codepoint, best first: the 72x72 PNG,
+    the SVG if svg is set, then the PNG without variation selectors
+    (Twemoji drops FE0F from many filenames)
+    """
+    urls = [f"{TWEMOJI_BASE_URL}/72x72/{codepoint}.png"]
+    if svg:
+        urls.append(f"{TWEMOJI_BASE_URL}/svg/{codepoint}.svg")
+    if '-fe0f' in codepoint:
+        urls.append(f"{TWEMOJI_BASE_URL}/72x72/{codepoint.replace('-fe0f', '')}.png")
+    return urls
+
+
+def fetch_image(session, urls, filepath):
+    """
+    Save the first of urls that downloads successfully to filepath
+
+    Returns:
+        (success, error_message) - on failure, the error from the first URL
+    """
+    first_error = None
+
+    for url in urls:
+        try:
+            response = session.get(url, timeout=10)
+            response.raise_for_status()
+
+            with open(filepath, 'wb') as f:
+                f.write(response.content)
+
+            return True, None
+
+        except Exception as e:
+            if first_error is None:
+                first_error = str(e)
+
+    return False, first_error
+
+
+def download_concurrently(fetch, items):
+    """
+    Yield fetch(session, item) for each item, in order, running up to
+    MAX_WORKERS fetches at once on one pooled requests session
+    """
+    # One session shared by all workers, so the HTTPS connection to the
+    # CDN is reused instead of re-handshaking per image
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=MAX_WORKERS)
+    session.mount('https://', adapter)
+
+    with session, ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        yield from executor.map(lambda item: fetch(session, item), items)
+
+
+def fetch_emoji_image(session, emoji, output_dir):
+    """
+    Download one emoji image
+
+    Returns:
+        (success, error_message)
+    """
+    codepoint, filename = get_image_filename(emoji)
+    return fetch_image(session, twemoji_urls(codepoint), output_dir / filename)
+
+
 def download_test_images(sample_file='data/test_sample.json'):
     """Download emoji images for test sample"""
 
@@ -24,47 +116,28 @@ def download_test_images(sample_file='data/test_sample.json'):
     # We'll use Twemoji (Twitter's emoji) as they're free and open source
     # URL format: https://cdn.jsdelivr.net/gh/twitter/twemoji@latest/assets/72x72/{codepoint}.png
 
-    downloaded = 0
     failed = []
 
-    for emoji in sample:
-        # Convert codepoint to lowercase and handle multi-codepoint emoji
-        codepoint = emoji['codepoint'].replace(' ', '-').lower()
+    # Skip images from previous runs: one directory scan instead of an
+    # HTTP round trip (or a stat call) per emoji
+    existing = {p.name for p in output_dir.iterdir()}
+    to_fetch = [e for e in sample if get_image_filename(e)[1] not in existing]
+    downloaded = len(sample) - len(to_fetch)
 
-        # Twemoji URL
-        url = f"https://cdn.jsdelivr.net/gh/twitter/twemoji@latest/assets/72x72/{codepoint}.png"
+    if downloaded:
+        print(f"  {downloaded} images already present, skipping")
 
-        # Create safe filename
-        safe_name = emoji['name'].replace('/', '-').replace(' ', '_')
-        filename = f"{codepoint}_{safe_name}.png"
-        filepath = output_dir / filename
-
-        try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
+    results = download_concurrently(
+        lambda session, emoji: fetch_emoji_image(session, emoji, output_dir), to_fetch
+    )
 
+    for emoji, (success, error) in zip(to_fetch, results):
+        if success:
             downloaded += 1
             if downloaded % 10 == 0:
                 print(f"  Downloaded {downloaded}/{len(sample)}...")
-
-        except Exception as e:
-            failed.append((emoji['emoji'], emoji['name'], str(e)))
-            # Try without variation selectors for some emoji
-            if 'fe0f' in codepoint.lower():
-                alt_codepoint = codepoint.replace('-fe0f', '')
-                alt_url = f"https://cdn.jsdelivr.net/gh/twitter/twemoji@latest/assets/72x72/{alt_codepoint}.png"
-                try:
-                    response = requests.get(alt_url, timeout=10)
-                    response.raise_for_status()
-                    with open(filepath, 'wb') as f:
-                        f.write(response.content)
-                    downloaded += 1
-                    failed.pop()  # Remove from failed list
-                except:
-                    pass
+        else:
+            failed.append((emoji['emoji'], emoji['name'], error))
 
     print(f"\n✅ Downloaded {downloaded}/{len(sample)} images")
 
@@ -14,21 +14,216 @@ Usage:
 
 import json
 import hashlib
+import os
 import sys
 import re
-from typing import Optional, Tuple, Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial, wraps
+from itertools import repeat
+from typing import Optional, Tuple, Dict, FrozenSet, Iterable, List
+
+
+# One emoji cluster: a base character, then variation selectors (U+FE0E/FE0F),
+# then skin tone modifiers (U+1F3FB-1F3FF), then any ZWJ (U+200D) joins,
+# each of which takes the following character with it
+_EMOJI_CLUSTER_RE = re.compile(
+    '.[\uFE0E\uFE0F]*[\U0001F3FB-\U0001F3FF]*(?:\u200D.?)*',
+    re.DOTALL,
+)
+
+# Runs of emoji characters in free text
+# Emoji range: U+1F300 - U+1FAFF (most emoji)
+# Plus other ranges for symbols, etc.
+_EMOJI_EXTRACT_RE = re.compile(
+    "["
+    "\U0001F300-\U0001FAFF"  # Emoticons, symbols, pictographs
+    "\U0001F000-\U0001F02F"  # Mahjong tiles, dominoes
+    "\U0001F0A0-\U0001F0FF"  # Playing cards
+    "\U00002600-\U000027BF"  # Miscellaneous symbols
+    "\U0001F600-\U0001F64F"  # Emoticons
+    "\U0001F680-\U0001F6FF"  # Transport and map symbols
+    "\U00002700-\U000027BF"  # Dingbats
+    "\U0001F900-\U0001F9FF"  # Supplemental symbols
+    "\U0001FA70-\U0001FAFF"  # Extended symbols
+    "\U00002B50"              # Star
+    "\U00002764"              # Red heart
+    "\U0000231A-\U0000231B"  # Watch, hourglass
+    "\U000023E9-\U000023F3"  # Media controls
+    "\U000023F8-\U000023FA"  # Pause, stop
+    "\U0000FE0F"              # Variation selector
+    "]+"
+)
+
+# Characters that split_emoji attaches to the preceding character
+_CLUSTER_CONTINUATION_CHARS = frozenset(
+    ['\uFE0E', '\uFE0F', '\u200D'] + [chr(cp) for cp in range(0x1F3FB, 0x1F400)]
+)
+
+# Base58 digits accumulated per machine-word chunk when decoding (58**10 < 2**64)
+_B58_CHUNK_DIGITS = 10
+_B58_CHUNK_BASE = 58 ** _B58_CHUNK_DIGITS
+
+# Longest input the decode caches keep: real addresses are under ~100
+# emoji, and caching whole documents would keep them alive after the call
+_MAX_CACHED_INPUT_LENGTH = 128
+
+
+def _short_input_cache(func):
+    """
+    lru_cache func (a one-string-argument function) for inputs of at most
+    _MAX_CACHED_INPUT_LENGTH characters; longer inputs bypass the cache
+    """
+    cached = lru_cache(maxsize=1024)(func)
+
+    @wraps(func)
+    def call(text):
+        if len(text) > _MAX_CACHED_INPUT_LENGTH:
+            return func(text)
+        return cached(text)
+
+    call.cache_info = cached.cache_info
+    call.cache_clear = cached.cache_clear
+    return call
+
+
+@_short_input_cache
+def split_emoji(emoji_string: str) -> Tuple[str, ...]:
+    """
+    Split emoji string into individual emoji characters
+
+    This handles multi-codepoint emoji correctly. Results for address-sized
+    strings are cached, since the same addresses are typically decoded
+    repeatedly.
+    """
+    return tuple(_EMOJI_CLUSTER_RE.findall(emoji_string))
+
+
+def _double_sha256(data: bytes) -> bytes:
+    """SHA256(SHA256(data)), the Base58Check checksum hash"""
+    sha256 = hashlib.sha256
+    return sha256(sha256(data).digest()).digest()
+
+
+@lru_cache(maxsize=None)
+def _read_mapping_bytes(mapping_path: str, mtime: float) -> bytes:
+    """
+    Raw contents of a mapping file, read once and shared by every codec
+    that uses it
+
+    Keyed on modification time as well as path, so a regenerated file
+    is re-read rather than served stale. Only the immutable bytes are
+    shared: each codec parses its own copy, so changes to one codec's
+    mapping never leak into another.
+    """
+    with open(mapping_path, 'rb') as f:
+        return f.read()
+
+
+def _decode_emoji(reverse_mapping: Dict[str, str], decode_table: Dict[int, str],
+                  single_codepoint_emoji: FrozenSet[str],
+                  emoji_address: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Side-effect-free body of EmojiCodec.decode()
+
+    Takes the codec's lookup tables rather than the codec itself, so the
+    per-instance cache built on it holds no reference back to the codec.
+
+    Returns:
+        (base58_address, unknown_emoji)
+    """
+    # Fast path: every character is a complete, mapped emoji on its own
+    if single_codepoint_emoji.issuperset(emoji_address):
+        return emoji_address.translate(decode_table), ()
+
+    parts = []
+    unknown_emoji = []
+
+    # Split emoji string into individual emoji
+    # (Some emoji are multi-codepoint, so we need to be careful)
+    emoji_list = split_emoji(emoji_address)
+
+    for emoji in emoji_list:
+        if emoji in reverse_mapping:
+            parts.append(reverse_mapping[emoji])
+        else:
+            # Unknown emoji
+            parts.append("?")
+            unknown_emoji.append(emoji)
+
+    return ''.join(parts), tuple(unknown_emoji)
+
+
+def _validate_checksum(b58_values: Dict[str, int], address: str) -> Tuple[bool, Optional[str]]:
+    """Checksum part of validate_base58check, for all-Base58 input"""
+    # Decode Base58
+    try:
+        decoded = _base58_decode(b58_values, address)
+    except Exception as e:
+        return False, f"Base58 decode error: {e}"
+
+    # Must be at least 5 bytes (1 version + 4 checksum)
+    if len(decoded) < 5:
+        return False, f"Address too short: {len(decoded)} bytes"
+
+    # Split payload and checksum
+    payload = decoded[:-4]
+    checksum = decoded[-4:]
+
+    # Calculate expected checksum
+    expected_checksum = _double_sha256(payload)[:4]
+
+    # Validate
+    if checksum != expected_checksum:
+        return False, f"Checksum mismatch (expected {expected_checksum.hex()}, got {checksum.hex()})"
+
+    return True, None
+
+
+def _base58_decode(b58_values: Dict[str, int], address: str) -> bytes:
+    """Decode Base58 string to bytes"""
+    decoded = 0
+
+    # Accumulate word-sized chunks first so the big integer is only
+    # multiplied once per chunk rather than once per character
+    for start in range(0, len(address), _B58_CHUNK_DIGITS):
+        chunk = address[start:start + _B58_CHUNK_DIGITS]
+        chunk_value = 0
+        for char in chunk:
+            chunk_value = chunk_value * 58 + b58_values[char]
+
+        if len(chunk) == _B58_CHUNK_DIGITS:
+            decoded = decoded * _B58_CHUNK_BASE + chunk_value
+        else:
+            decoded = decoded * 58 ** len(chunk) + chunk_value
+
+    # Convert to bytes
+    result = decoded.to_bytes((decoded.bit_length() + 7) // 8, byteorder='big')
+
+    # Handle leading zeros (represented as '1' in Base58)
+    num_leading_ones = len(address) - len(address.lstrip('1'))
+    result = b'\x00' * num_leading_ones + result
+
+    return result
 
 
 class EmojiCodec:
     """Encode and decode Bitcoin addresses to/from emoji"""
 
     def __init__(self, mapping_file='data/base58_emoji_mapping.json', verbose=True):
-        """Initialize codec with Base58→Emoji mapping"""
+        """
+        Initialize codec with Base58→Emoji mapping
+
+        With verbose=False the codec prints nothing: neither the load
+        message nor the unknown character/emoji warnings from encode/decode
+        (their success flag still reports the failure).
+        """
 
-        # Load mapping
-        with open(mapping_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Load mapping (the file is read once and shared across instances)
+        mapping_path = os.path.abspath(mapping_file)
+        data = json.loads(_read_mapping_bytes(mapping_path, os.path.getmtime(mapping_path)))
 
+        self.mapping_file = mapping_file
+        self.verbose = verbose
         self.base58_alphabet = data['base58_alphabet']
         self.mapping = data['mapping']
         self.mapping_strategy = data.get('mapping_strategy', 'distinct')
@@ -39,10 +234,62 @@ class EmojiCodec:
             emoji = emoji_data['emoji']
             self.reverse_mapping[emoji] = base58_char
 
+        # Single-codepoint emoji can be decoded in C by str.translate, as long
+        # as the input holds nothing that split_emoji would join into a cluster
+        single_codepoint = {
+            emoji: base58_char for emoji, base58_char in self.reverse_mapping.items()
+            if len(emoji) == 1 and emoji not in _CLUSTER_CONTINUATION_CHARS
+        }
+        self._decode_table = str.maketrans(single_codepoint)
+        self._single_codepoint_emoji = frozenset(single_codepoint)
+
+        # Base58 digit values (replaces str.index scans of the alphabet)
+        self._b58_values = {char: i for i, char in enumerate(self.base58_alphabet)}
+        self._alphabet_set = frozenset(self.base58_alphabet)
+        self._decodes_to_base58 = self._alphabet_set.issuperset(self.reverse_mapping.values())
+
+        # Flat Base58 → emoji lookup (avoids the inner dict on every char)
+        self._emoji_of = {char: emoji_data['emoji'] for char, emoji_data in self.mapping.items()}
+
+        # Translation table so well-formed input is encoded in C by str.translate
+        self._encode_table = str.maketrans(self._emoji_of)
+        self._mapped_chars = frozenset(self._emoji_of)
+
+        self._build_caches()
+
         if verbose:
             strategy_desc = "steganographic (common emoji)" if self.mapping_strategy == 'steganographic' else "distinct (unique emoji)"
             print(f"✅ Loaded {strategy_desc} mapping: {len(self.mapping)} Base58 chars → {len(self.reverse_mapping)} emoji")
 
+    def _build_caches(self):
+        """
+        Memoize the pure decode and checksum work per instance
+
+        Repeated scan/extract calls on the same address skip straight to
+        the result; longer inputs (e.g. a whole streamed document) are not
+        cached. The caches wrap module functions bound to this codec's
+        tables (not bound methods), so they don't keep the codec alive in
+        a cycle.
+        """
+        self._decode_cached = _short_input_cache(partial(
+            _decode_emoji, self.reverse_mapping, self._decode_table, self._single_codepoint_emoji
+        ))
+        self._validate_checksum_cached = _short_input_cache(partial(
+            _validate_checksum, self._b58_values
+        ))
+
+    def __getstate__(self):
+        """Pickle the codec's tables; the caches themselves can't be pickled"""
+        state = self.__dict__.copy()
+        del state['_decode_cached']
+        del state['_validate_checksum_cached']
+        return state
+
+    def __setstate__(self, state):
+        """Restore the tables and rebuild empty caches on them"""
+        self.__dict__.update(state)
+        self._build_caches()
+
     def encode(self, base58_address: str) -> Tuple[str, bool]:
         """
         Encode Base58 address to emoji
@@ -50,89 +297,79 @@ class EmojiCodec:
         Returns:
             (emoji_address, success)
         """
-        emoji_address = ""
+        # Fast path: every character is mapped
+        if self._mapped_chars.issuperset(base58_address):
+            return base58_address.translate(self._encode_table), True
+
+        parts = []
         unknown_chars = []
 
         for char in base58_address:
-            if char in self.mapping:
-                emoji_address += self.mapping[char]['emoji']
+            if char in self._emoji_of:
+                parts.append(self._emoji_of[char])
             else:
                 # Unknown character (not in Base58 alphabet)
-                emoji_address += "❓"
+                parts.append("❓")
                 unknown_chars.append(char)
 
         success = len(unknown_chars) == 0
 
-        if not success:
+        if not success and self.verbose:
             print(f"⚠️  Warning: Unknown characters found: {unknown_chars}")
 
-        return emoji_address, success
+        return ''.join(parts), success
 
-    def decode(self, emoji_address: str) -> Tuple[str, bool]:
+    def encode_tokens(self, base58_address: str) -> List[str]:
         """
-        Decode emoji address to Base58
+        Encode Base58 address to a list of emoji, one per input character
 
-        Returns:
-            (base58_address, success)
+        Unknown characters become "❓", as in encode(). Lets callers pair
+        characters with their emoji without re-splitting the joined string.
         """
-        base58_address = ""
-        unknown_emoji = []
+        emoji_of = self._emoji_of
+        return [emoji_of.get(char, "❓") for char in base58_address]
 
-        # Split emoji string into individual emoji
-        # (Some emoji are multi-codepoint, so we need to be careful)
-        emoji_list = self._split_emoji(emoji_address)
+    def encode_many(self, base58_addresses: List[str]) -> List[Tuple[str, bool]]:
+        """
+        Encode several Base58 addresses in one pass
 
-        for emoji in emoji_list:
-            if emoji in self.reverse_mapping:
-                base58_address += self.reverse_mapping[emoji]
+        Returns:
+            List of (emoji_address, success), one per input, as for encode()
+        """
+        encode_table = self._encode_table
+        mapped_chars = self._mapped_chars
+        results = []
+
+        for base58_address in base58_addresses:
+            if mapped_chars.issuperset(base58_address):
+                results.append((base58_address.translate(encode_table), True))
             else:
-                # Unknown emoji
-                base58_address += "?"
-                unknown_emoji.append(emoji)
+                results.append(self.encode(base58_address))
+
+        return results
 
+    def decode(self, emoji_address: str) -> Tuple[str, bool]:
+        """
+        Decode emoji address to Base58
+
+        Returns:
+            (base58_address, success)
+        """
+        base58_address, unknown_emoji = self._decode_cached(emoji_address)
         success = len(unknown_emoji) == 0
 
-        if not success:
-            print(f"⚠️  Warning: Unknown emoji found: {unknown_emoji}")
+        if not success and self.verbose:
+            print(f"⚠️  Warning: Unknown emoji found: {list(unknown_emoji)}")
 
         return base58_address, success
 
-    def _split_emoji(self, emoji_string: str) -> list:
+    def _split_emoji(self, emoji_string: str) -> Tuple[str, ...]:
         """
         Split emoji string into individual emoji characters
 
-        This handles multi-codepoint emoji correctly.
+        This handles multi-codepoint emoji correctly (see split_emoji).
         """
-        emoji_list = []
-        i = 0
-
-        while i < len(emoji_string):
-            # Start with current character
-            emoji = emoji_string[i]
-            i += 1
-
-            # Check for variation selectors (U+FE0F, U+FE0E)
-            while i < len(emoji_string) and emoji_string[i] in ['\uFE0F', '\uFE0E']:
-                emoji += emoji_string[i]
-                i += 1
-
-            # Check for skin tone modifiers (U+1F3FB - U+1F3FF)
-            while i < len(emoji_string) and '\U0001F3FB' <= emoji_string[i] <= '\U0001F3FF':
-                emoji += emoji_string[i]
-                i += 1
-
-            # Check for ZWJ sequences (U+200D)
-            while i < len(emoji_string) and emoji_string[i] == '\u200D':
-                # ZWJ followed by another emoji
-                emoji += emoji_string[i]  # ZWJ
-                i += 1
-                if i < len(emoji_string):
-                    emoji += emoji_string[i]  # Next character
-                    i += 1
-
-            emoji_list.append(emoji)
-
-        return emoji_list
+        return split_emoji(emoji_string)
 
     def validate_base58check(self, address: str) -> Tuple[bool, Optional[str]]:
         """
@@ -141,50 +378,23 @@ class EmojiCodec:
         Returns:
             (is_valid, error_message)
         """
-        # Check if all characters are valid Base58
-        for char in address:
-            if char not in self.base58_alphabet:
-                return False, f"Invalid character '{char}' (not in Base58 alphabet)"
+        # Check if all characters are valid Base58 (report the first bad one)
+        if not self._alphabet_set.issuperset(address):
+            char = next(char for char in address if char not in self._alphabet_set)
+            return False, f"Invalid character '{char}' (not in Base58 alphabet)"
 
-        # Decode Base58
-        try:
-            decoded = self._base58_decode(address)
-        except Exception as e:
-            return False, f"Base58 decode error: {e}"
+        return self._validate_checksum_cached(address)
 
-        # Must be at least 5 bytes (1 version + 4 checksum)
-        if len(decoded) < 5:
-            return False, f"Address too short: {len(decoded)} bytes"
-
-        # Split payload and checksum
-        payload = decoded[:-4]
-        checksum = decoded[-4:]
-
-        # Calculate expected checksum
-        hash_result = hashlib.sha256(hashlib.sha256(payload).digest()).digest()
-        expected_checksum = hash_result[:4]
-
-        # Validate
-        if checksum != expected_checksum:
-            return False, f"Checksum mismatch (expected {expected_checksum.hex()}, got {checksum.hex()})"
-
-        return True, None
-
-    def _base58_decode(self, address: str) -> bytes:
-        """Decode Base58 string to bytes"""
-        decoded = 0
-
-        for char in address:
-            decoded = decoded * 58 + self.base58_alphabet.index(char)
-
-        # Convert to bytes
-        result = decoded.to_bytes((decoded.bit_length() + 7) // 8, byteorder='big')
-
-        # Handle leading zeros (represented as '1' in Base58)
-        num_leading_ones = len(address) - len(address.lstrip('1'))
-        result = b'\x00' * num_leading_ones + result
+    def _validate_decoded(self, base58_address: str) -> Tuple[bool, Optional[str]]:
+        """
+        Validate the output of a successful decode()
 
-        return result
+        When every emoji maps to a Base58 character, decode() output cannot
+        contain anything else, so the alphabet pass is skipped.
+        """
+        if self._decodes_to_base58:
+            return self._validate_checksum_cached(base58_address)
+        return self.validate_base58check(base58_address)
 
     def scan(self, emoji_address: str, validate: bool = True) -> Dict:
         """
@@ -218,7 +428,7 @@ class EmojiCodec:
 
         # Validate checksum
         if validate:
-            is_valid, error_msg = self.validate_base58check(base58_address)
+            is_valid, error_msg = self._validate_decoded(base58_address)
             result['checksum_valid'] = is_valid
 
             if not is_valid:
@@ -248,11 +458,55 @@ class EmojiCodec:
                 'start_index': int,  # Character index in text
             }
         """
-        results = []
-
         # Extract all emoji from text
         extracted_emoji = self._extract_emoji_from_text(text)
 
+        return self._decode_extracted(text, extracted_emoji, validate)
+
+    def extract_from_stream(self, chunks: Iterable[str], validate: bool = True) -> List[Dict]:
+        """
+        Extract emoji addresses from text that arrives in pieces
+
+        Same as extract_from_text, but takes an iterable of strings (e.g. an
+        open file, read line by line), so a large document never has to be
+        held in memory. Only the extracted emoji are kept, so the 'text'
+        field of each result is None.
+        """
+        # The extractor only keeps matched characters, and a str chunk never
+        # splits a code point, so per-chunk extraction joins up exactly
+        extracted_emoji = ''.join([self._extract_emoji_from_text(chunk) for chunk in chunks])
+
+        return self._decode_extracted(None, extracted_emoji, validate)
+
+    def extract_from_texts(self, texts: List[str], validate: bool = True,
+                           max_workers: Optional[int] = None) -> List[List[Dict]]:
+        """
+        Run extract_from_text over many messages using a process pool
+
+        Each worker process receives a copy of this codec once, then handles
+        texts in batches, so results match extract_from_text even if the
+        mapping file has changed since the codec was built. Worth it for
+        large batches (e.g. a whole chat log); for a handful of messages,
+        call extract_from_text directly, since starting the pool costs far
+        more than the scanning.
+
+        Returns:
+            One extract_from_text result list per input text, in order
+        """
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_extract_worker,
+            initargs=(self,),
+        ) as executor:
+            return list(executor.map(
+                _extract_in_worker, texts, repeat(validate), chunksize=64
+            ))
+
+    def _decode_extracted(self, text: Optional[str], extracted_emoji: str,
+                          validate: bool) -> List[Dict]:
+        """Build extract_from_text results for an extracted emoji string"""
+        results = []
+
         if not extracted_emoji:
             results.append({
                 'text': text,
@@ -286,7 +540,7 @@ class EmojiCodec:
         else:
             # Validate checksum
             if validate:
-                is_valid, error_msg = self.validate_base58check(base58_address)
+                is_valid, error_msg = self._validate_decoded(base58_address)
                 result['checksum_valid'] = is_valid
 
                 if not is_valid:
@@ -303,34 +557,25 @@ class EmojiCodec:
 
         Returns concatenated emoji string, preserving order
         """
-        # Use regex to match emoji characters
-        # Emoji range: U+1F300 - U+1FAFF (most emoji)
-        # Plus other ranges for symbols, etc.
-
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F300-\U0001FAFF"  # Emoticons, symbols, pictographs
-            "\U0001F000-\U0001F02F"  # Mahjong tiles, dominoes
-            "\U0001F0A0-\U0001F0FF"  # Playing cards
-            "\U00002600-\U000027BF"  # Miscellaneous symbols
-            "\U0001F600-\U0001F64F"  # Emoticons
-            "\U0001F680-\U0001F6FF"  # Transport and map symbols
-            "\U00002700-\U000027BF"  # Dingbats
-            "\U0001F900-\U0001F9FF"  # Supplemental symbols
-            "\U0001FA70-\U0001FAFF"  # Extended symbols
-            "\U00002B50"              # Star
-            "\U00002764"              # Red heart
-            "\U0000231A-\U0000231B"  # Watch, hourglass
-            "\U000023E9-\U000023F3"  # Media controls
-            "\U000023F8-\U000023FA"  # Pause, stop
-            "\U0000FE0F"              # Variation selector
-            "]+"
-        )
-
-        emoji_list = emoji_pattern.findall(text)
+        emoji_list = _EMOJI_EXTRACT_RE.findall(text)
         return ''.join(emoji_list)
 
 
+# Codec owned by each extract_from_texts worker process
+_worker_codec = None
+
+
+def _init_extract_worker(codec: EmojiCodec):
+    """Install the caller's codec once per process"""
+    global _worker_codec
+    _worker_codec = codec
+
+
+def _extract_in_worker(text: str, validate: bool) -> List[Dict]:
+    """extract_from_text on the worker's codec"""
+    return _worker_codec.extract_from_text(text, validate)
+
+
 def print_banner():
     """Print application banner"""
     print()
@@ -369,7 +614,7 @@ def cmd_encode(codec: EmojiCodec, base58_address: str):
 
     # Show character-by-character mapping
     print("   Character mapping:")
-    emoji_list = list(codec._split_emoji(emoji_address))
+    emoji_list = codec.encode_tokens(base58_address)
     for i, char in enumerate(base58_address[:20]):  # Show first 20
         if i < len(emoji_list):
             if char in codec.mapping:
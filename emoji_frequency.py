@@ -13,6 +13,91 @@ import json
 from typing import List, Dict
 
 
+# Most commonly used emoji, sorted by usage frequency (most common first).
+# Static, so built once at import rather than on every call.
+#
+# Based on research from:
+# - Emojitracker (Twitter real-time stats)
+# - Unicode CLDR annotations
+# - Various social media studies
+COMMON_EMOJI = (
+    # Tier 1: Ultra-common (billions of uses)
+    {"emoji": "😂", "name": "face with tears of joy", "usage_tier": 1},
+    {"emoji": "❤️", "name": "red heart", "usage_tier": 1},
+    {"emoji": "🥰", "name": "smiling face with hearts", "usage_tier": 1},
+    {"emoji": "😍", "name": "smiling face with heart-eyes", "usage_tier": 1},
+    {"emoji": "😊", "name": "smiling face with smiling eyes", "usage_tier": 1},
+
+    # Tier 2: Very common (hundreds of millions)
+    {"emoji": "🎉", "name": "party popper", "usage_tier": 2},
+    {"emoji": "😭", "name": "loudly crying face", "usage_tier": 2},
+    {"emoji": "😘", "name": "face blowing a kiss", "usage_tier": 2},
+    {"emoji": "🥺", "name": "pleading face", "usage_tier": 2},
+    {"emoji": "🤣", "name": "rolling on the floor laughing", "usage_tier": 2},
+    {"emoji": "💕", "name": "two hearts", "usage_tier": 2},
+    {"emoji": "✨", "name": "sparkles", "usage_tier": 2},
+    {"emoji": "🙏", "name": "folded hands", "usage_tier": 2},
+    {"emoji": "😁", "name": "beaming face with smiling eyes", "usage_tier": 2},
+    {"emoji": "💖", "name": "sparkling heart", "usage_tier": 2},
+
+    # Tier 3: Common (tens of millions)
+    {"emoji": "👍", "name": "thumbs up", "usage_tier": 3},
+    {"emoji": "🔥", "name": "fire", "usage_tier": 3},
+    {"emoji": "💪", "name": "flexed biceps", "usage_tier": 3},
+    {"emoji": "🌟", "name": "glowing star", "usage_tier": 3},
+    {"emoji": "😉", "name": "winking face", "usage_tier": 3},
+    {"emoji": "🤗", "name": "hugging face", "usage_tier": 3},
+    {"emoji": "😎", "name": "smiling face with sunglasses", "usage_tier": 3},
+    {"emoji": "💯", "name": "hundred points", "usage_tier": 3},
+    {"emoji": "🙌", "name": "raising hands", "usage_tier": 3},
+    {"emoji": "💙", "name": "blue heart", "usage_tier": 3},
+
+    # Tier 4: Moderately common
+    {"emoji": "🤔", "name": "thinking face", "usage_tier": 4},
+    {"emoji": "😌", "name": "relieved face", "usage_tier": 4},
+    {"emoji": "🎊", "name": "confetti ball", "usage_tier": 4},
+    {"emoji": "💜", "name": "purple heart", "usage_tier": 4},
+    {"emoji": "😄", "name": "grinning face with smiling eyes", "usage_tier": 4},
+    {"emoji": "🤷", "name": "person shrugging", "usage_tier": 4},
+    {"emoji": "💚", "name": "green heart", "usage_tier": 4},
+    {"emoji": "🎈", "name": "balloon", "usage_tier": 4},
+    {"emoji": "🥳", "name": "partying face", "usage_tier": 4},
+    {"emoji": "😇", "name": "smiling face with halo", "usage_tier": 4},
+
+    # Tier 5: Regular use
+    {"emoji": "🤩", "name": "star-struck", "usage_tier": 5},
+    {"emoji": "😃", "name": "grinning face with big eyes", "usage_tier": 5},
+    {"emoji": "🙃", "name": "upside-down face", "usage_tier": 5},
+    {"emoji": "💛", "name": "yellow heart", "usage_tier": 5},
+    {"emoji": "😬", "name": "grimacing face", "usage_tier": 5},
+    {"emoji": "🤞", "name": "crossed fingers", "usage_tier": 5},
+    {"emoji": "👏", "name": "clapping hands", "usage_tier": 5},
+    {"emoji": "🥹", "name": "face holding back tears", "usage_tier": 5},
+    {"emoji": "😅", "name": "grinning face with sweat", "usage_tier": 5},
+    {"emoji": "👋", "name": "waving hand", "usage_tier": 5},
+
+    # Additional distinct emoji to reach 58
+    {"emoji": "🎁", "name": "wrapped gift", "usage_tier": 6},
+    {"emoji": "🍀", "name": "four leaf clover", "usage_tier": 6},
+    {"emoji": "🌈", "name": "rainbow", "usage_tier": 6},
+    {"emoji": "⭐", "name": "star", "usage_tier": 6},
+    {"emoji": "🌺", "name": "hibiscus", "usage_tier": 6},
+    {"emoji": "🌸", "name": "cherry blossom", "usage_tier": 6},
+    {"emoji": "🍕", "name": "pizza", "usage_tier": 6},
+    {"emoji": "🍔", "name": "hamburger", "usage_tier": 6},
+    {"emoji": "☕", "name": "hot beverage", "usage_tier": 6},
+    {"emoji": "🎮", "name": "video game", "usage_tier": 6},
+    {"emoji": "⚡", "name": "high voltage", "usage_tier": 6},
+    {"emoji": "🌙", "name": "crescent moon", "usage_tier": 6},
+    {"emoji": "☀️", "name": "sun", "usage_tier": 6},
+    {"emoji": "🎵", "name": "musical note", "usage_tier": 6},
+    {"emoji": "🎶", "name": "musical notes", "usage_tier": 6},
+    {"emoji": "🌻", "name": "sunflower", "usage_tier": 6},
+    {"emoji": "🐶", "name": "dog face", "usage_tier": 6},
+    {"emoji": "🐱", "name": "cat face", "usage_tier": 6},
+)
+
+
 def get_common_emoji_list() -> List[Dict]:
     """
     Get list of most commonly used emoji based on:
@@ -20,92 +105,10 @@ def get_common_emoji_list() -> List[Dict]:
     - Social media usage statistics
     - Cross-platform availability
 
-    Returns list sorted by usage frequency (most common first)
+    Returns list sorted by usage frequency (most common first). The list is
+    a fresh copy, but the entry dicts are shared with COMMON_EMOJI.
     """
-
-    # Based on research from:
-    # - Emojitracker (Twitter real-time stats)
-    # - Unicode CLDR annotations
-    # - Various social media studies
-
-    common_emoji = [
-        # Tier 1: Ultra-common (billions of uses)
-        {"emoji": "😂", "name": "face with tears of joy", "usage_tier": 1},
-        {"emoji": "❤️", "name": "red heart", "usage_tier": 1},
-        {"emoji": "🥰", "name": "smiling face with hearts", "usage_tier": 1},
-        {"emoji": "😍", "name": "smiling face with heart-eyes", "usage_tier": 1},
-        {"emoji": "😊", "name": "smiling face with smiling eyes", "usage_tier": 1},
-
-        # Tier 2: Very common (hundreds of millions)
-        {"emoji": "🎉", "name": "party popper", "usage_tier": 2},
-        {"emoji": "😭", "name": "loudly crying face", "usage_tier": 2},
-        {"emoji": "😘", "name": "face blowing a kiss", "usage_tier": 2},
-        {"emoji": "🥺", "name": "pleading face", "usage_tier": 2},
-        {"emoji": "🤣", "name": "rolling on the floor laughing", "usage_tier": 2},
-        {"emoji": "💕", "name": "two hearts", "usage_tier": 2},
-        {"emoji": "✨", "name": "sparkles", "usage_tier": 2},
-        {"emoji": "🙏", "name": "folded hands", "usage_tier": 2},
-        {"emoji": "😁", "name": "beaming face with smiling eyes", "usage_tier": 2},
-        {"emoji": "💖", "name": "sparkling heart", "usage_tier": 2},
-
-        # Tier 3: Common (tens of millions)
-        {"emoji": "👍", "name": "thumbs up", "usage_tier": 3},
-        {"emoji": "🔥", "name": "fire", "usage_tier": 3},
-        {"emoji": "💪", "name": "flexed biceps", "usage_tier": 3},
-        {"emoji": "🌟", "name": "glowing star", "usage_tier": 3},
-        {"emoji": "😉", "name": "winking face", "usage_tier": 3},
-        {"emoji": "🤗", "name": "hugging face", "usage_tier": 3},
-        {"emoji": "😎", "name": "smiling face with sunglasses", "usage_tier": 3},
-        {"emoji": "💯", "name": "hundred points", "usage_tier": 3},
-        {"emoji": "🙌", "name": "raising hands", "usage_tier": 3},
-        {"emoji": "💙", "name": "blue heart", "usage_tier": 3},
-
-        # Tier 4: Moderately common
-        {"emoji": "🤔", "name": "thinking face", "usage_tier": 4},
-        {"emoji": "😌", "name": "relieved face", "usage_tier": 4},
-        {"emoji": "🎊", "name": "confetti ball", "usage_tier": 4},
-        {"emoji": "💜", "name": "purple heart", "usage_tier": 4},
-        {"emoji": "😄", "name": "grinning face with smiling eyes", "usage_tier": 4},
-        {"emoji": "🤷", "name": "person shrugging", "usage_tier": 4},
-        {"emoji": "💚", "name": "green heart", "usage_tier": 4},
-        {"emoji": "🎈", "name": "balloon", "usage_tier": 4},
-        {"emoji": "🥳", "name": "partying face", "usage_tier": 4},
-        {"emoji": "😇", "name": "smiling face with halo", "usage_tier": 4},
-
-        # Tier 5: Regular use
-        {"emoji": "🤩", "name": "star-struck", "usage_tier": 5},
-        {"emoji": "😃", "name": "grinning face with big eyes", "usage_tier": 5},
-        {"emoji": "🙃", "name": "upside-down face", "usage_tier": 5},
-        {"emoji": "💛", "name": "yellow heart", "usage_tier": 5},
-        {"emoji": "😬", "name": "grimacing face", "usage_tier": 5},
-        {"emoji": "🤞", "name": "crossed fingers", "usage_tier": 5},
-        {"emoji": "👏", "name": "clapping hands", "usage_tier": 5},
-        {"emoji": "🥹", "name": "face holding back tears", "usage_tier": 5},
-        {"emoji": "😅", "name": "grinning face with sweat", "usage_tier": 5},
-        {"emoji": "👋", "name": "waving hand", "usage_tier": 5},
-
-        # Additional distinct emoji to reach 58
-        {"emoji": "🎁", "name": "wrapped gift", "usage_tier": 6},
-        {"emoji": "🍀", "name": "four leaf clover", "usage_tier": 6},
-        {"emoji": "🌈", "name": "rainbow", "usage_tier": 6},
-        {"emoji": "⭐", "name": "star", "usage_tier": 6},
-        {"emoji": "🌺", "name": "hibiscus", "usage_tier": 6},
-        {"emoji": "🌸", "name": "cherry blossom", "usage_tier": 6},
-        {"emoji": "🍕", "name": "pizza", "usage_tier": 6},
-        {"emoji": "🍔", "name": "hamburger", "usage_tier": 6},
-        {"emoji": "☕", "name": "hot beverage", "usage_tier": 6},
-        {"emoji": "🎮", "name": "video game", "usage_tier": 6},
-        {"emoji": "⚡", "name": "high voltage", "usage_tier": 6},
-        {"emoji": "🌙", "name": "crescent moon", "usage_tier": 6},
-        {"emoji": "☀️", "name": "sun", "usage_tier": 6},
-        {"emoji": "🎵", "name": "musical note", "usage_tier": 6},
-        {"emoji": "🎶", "name": "musical notes", "usage_tier": 6},
-        {"emoji": "🌻", "name": "sunflower", "usage_tier": 6},
-        {"emoji": "🐶", "name": "dog face", "usage_tier": 6},
-        {"emoji": "🐱", "name": "cat face", "usage_tier": 6},
-    ]
-
-    return common_emoji
+    return list(COMMON_EMOJI)
 
 
 def create_steganographic_mapping(
@@ -124,8 +127,8 @@ def create_steganographic_mapping(
     """
 
     # Load visual distinctiveness data
-    with open(candidates_file, 'r', encoding='utf-8') as f:
-        distinct_candidates = json.load(f)
+    with open(candidates_file, 'rb') as f:
+        distinct_candidates = json.loads(f.read())
 
     # Get common emoji list
     common_emoji = get_common_emoji_list()
@@ -170,12 +173,12 @@ def create_steganographic_mapping(
     # From visual_similarity analysis, we know heart variants are too similar
     # Keep only ONE heart variant
     confusable_patterns = {
-        'heart': ['❤️'],  # Keep only red heart
+        'heart': {'❤️'},  # Keep only red heart
         # Other patterns can be added
     }
 
     filtered_common = []
-    seen_patterns = {}
+    seen_patterns = set()
 
     for emoji_data in common_emoji:
         name = emoji_data['name']
@@ -184,12 +187,11 @@ def create_steganographic_mapping(
         # Check if this emoji matches a confusable pattern
         is_confusable = False
         for pattern, allowed in confusable_patterns.items():
-            if pattern in name:
-                if emoji not in allowed:
-                    if pattern in seen_patterns:
-                        is_confusable = True
-                        break
-                    seen_patterns[pattern] = True
+            if pattern in name and emoji not in allowed:
+                if pattern in seen_patterns:
+                    is_confusable = True
+                    break
+                seen_patterns.add(pattern)
 
         if not is_confusable:
             filtered_common.append(emoji_data)
@@ -200,12 +202,15 @@ def create_steganographic_mapping(
     # Check if we have enough
     if len(filtered_common) < 58:
         # Add distinct emoji to fill remaining slots
+        seen_emoji = {e['emoji'] for e in filtered_common}
+
         for candidate in distinct_candidates:
             if len(filtered_common) >= 58:
                 break
 
             # Check if already in list
-            if candidate['emoji'] not in [e['emoji'] for e in filtered_common]:
+            if candidate['emoji'] not in seen_emoji:
+                seen_emoji.add(candidate['emoji'])
                 filtered_common.append({
                     'emoji': candidate['emoji'],
                     'name': candidate['name'],
@@ -214,17 +219,17 @@ def create_steganographic_mapping(
                 })
 
     # Create mapping
-    mapping = {}
-
-    for i, char in enumerate(priority_order[:58]):
-        if i < len(filtered_common):
-            emoji_data = filtered_common[i]
-            mapping[char] = {
-                'emoji': emoji_data['emoji'],
-                'name': emoji_data['name'],
-                'usage_tier': emoji_data.get('usage_tier', 7),
-                'priority': i + 1
-            }
+    # zip stops at the shorter input, so characters beyond the emoji we
+    # have are simply left unmapped
+    mapping = {
+        char: {
+            'emoji': emoji_data['emoji'],
+            'name': emoji_data['name'],
+            'usage_tier': emoji_data.get('usage_tier', 7),
+            'priority': i + 1
+        }
+        for i, (char, emoji_data) in enumerate(zip(priority_order[:58], filtered_common))
+    }
 
     # Save mapping
     output = {
@@ -241,24 +246,29 @@ def create_steganographic_mapping(
     print(f"✅ Steganographic mapping saved to: {output_file}")
     print()
 
-    # Print summary
-    print("=" * 80)
-    print("TOP 20 STEGANOGRAPHIC MAPPINGS")
-    print("=" * 80)
-    print(f"{'Base58':<8} {'Emoji':<6} {'Name':<40} {'Tier':<6}")
-    print("-" * 80)
+    # Print summary, collected and written in one go
+    lines = []
+    out = lines.append
 
-    for i, char in enumerate(priority_order[:20]):
+    out("=" * 80)
+    out("TOP 20 STEGANOGRAPHIC MAPPINGS")
+    out("=" * 80)
+    out(f"{'Base58':<8} {'Emoji':<6} {'Name':<40} {'Tier':<6}")
+    out("-" * 80)
+
+    for char in priority_order[:20]:
         if char in mapping:
             m = mapping[char]
             tier = m.get('usage_tier', 'N/A')
-            print(f"{char:<8} {m['emoji']:<6} {m['name']:<40} {tier:<6}")
+            out(f"{char:<8} {m['emoji']:<6} {m['name']:<40} {tier:<6}")
 
-    print()
-    print("Tier 1-2: Ultra-common emoji (billions of uses)")
-    print("Tier 3-4: Common emoji (millions of uses)")
-    print("Tier 5+:   Regular emoji")
-    print()
+    out("")
+    out("Tier 1-2: Ultra-common emoji (billions of uses)")
+    out("Tier 3-4: Common emoji (millions of uses)")
+    out("Tier 5+:   Regular emoji")
+    out("")
+
+    print("\n".join(lines))
 
     return mapping
 
@@ -278,13 +288,12 @@ def main():
     print()
 
     example_address = "1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa"
-    encoded = ""
 
-    for char in example_address:
-        if char in mapping:
-            encoded += mapping[char]['emoji']
-        else:
-            encoded += "❓"
+    # One translate table for the whole address; characters without an
+    # emoji show up as ❓
+    table = dict.fromkeys(map(ord, example_address), "❓")
+    table.update(str.maketrans({char: m['emoji'] for char, m in mapping.items()}))
+    encoded = example_address.translate(table)
 
     print(f"Address: {example_address}")
     print(f"Encoded: {encoded}")
@@ -9,21 +9,28 @@ import json
 import os
 import re
 
+# Matches one data line of emoji-test.txt (see format notes in the loop)
+_EMOJI_TEST_RE = re.compile(r'^([0-9A-F\s]+)\s*;\s*(\S+)\s*#\s*(\S+)\s+E(\S+)\s+(.+)$')
+
 def scrape_emoji_test():
     """Scrape the Unicode emoji test file for emoji data"""
 
     url = "https://unicode.org/Public/emoji/16.0/emoji-test.txt"
     print(f"Fetching {url}...")
 
-    response = requests.get(url, timeout=30)
+    response = requests.get(url, timeout=30, stream=True)
     response.raise_for_status()
+    # emoji-test.txt is always UTF-8, whatever charset (if any) the server
+    # declares; requests would otherwise fall back to ISO-8859-1 for text/plain
+    response.encoding = 'utf-8'
 
     print("Parsing emoji test data...")
 
     emoji_data = []
-    lines = response.text.split('\n')
 
-    for line in lines:
+    # Parse lines as they arrive rather than holding a second, split copy
+    # of the whole file in memory
+    for line in response.iter_lines(decode_unicode=True):
         # Skip comments and empty lines
         if not line or line.startswith('#'):
             continue
@@ -32,7 +39,7 @@ def scrape_emoji_test():
         # codepoint ; status # emoji E version name
         # Example: 1F600 ; fully-qualified # 😀 E1.0 grinning face
 
-        match = re.match(r'^([0-9A-F\s]+)\s*;\s*(\S+)\s*#\s*(\S+)\s+E(\S+)\s+(.+)$', line)
+        match = _EMOJI_TEST_RE.match(line)
         if match:
             codepoints = match.group(1).strip()
             status = match.group(2)
@@ -45,7 +52,10 @@ def scrape_emoji_test():
                 'status': status,
                 'emoji': emoji_char,
                 'version': version,
-                'name': name
+                'name': name,
+                # Lowercased once here so downstream keyword matching
+                # doesn't redo it on every run
+                'name_lower': name.lower()
             }
 
             emoji_data.append(emoji_info)
@@ -5,15 +5,27 @@ Select a diverse test sample of emoji for prototyping visual similarity analysis
 
 import json
 import random
+import re
+
+# (category, name pattern), tried top to bottom; the order is the old
+# if/elif priority, so 'cat face' is a face rather than an animal
+_NAME_RULES = (
+    ('faces', re.compile('face|smile|grin')),
+    ('hands', re.compile('hand|finger|fist')),
+    ('animals', re.compile('cat|dog|bird|animal|monkey|bear|lion')),
+    ('food', re.compile('food|fruit|pizza|burger|coffee')),
+    ('flags', re.compile('flag')),
+    ('symbols', re.compile('heart|star|circle|square|triangle|arrow')),
+    ('objects', re.compile('phone|computer|book|pen|car|house')),
+)
 
 def select_test_sample(input_file='data/emoji_metadata.json', output_file='data/test_sample.json', sample_size=100):
     """Select a diverse sample of emoji for testing"""
 
-    with open(input_file, 'r', encoding='utf-8') as f:
-        all_emoji = json.load(f)
-
-    # Filter to fully-qualified only
-    fully_qualified = [e for e in all_emoji if e['status'] == 'fully-qualified']
+    # Decode the raw bytes in one call and filter to fully-qualified only;
+    # the rest of the metadata list is dropped straight away
+    with open(input_file, 'rb') as f:
+        fully_qualified = [e for e in json.loads(f.read()) if e['status'] == 'fully-qualified']
     print(f"Total fully-qualified emoji: {len(fully_qualified)}")
 
     # Categorize by emoji type based on name patterns
@@ -29,24 +41,11 @@ def select_test_sample(input_file='data/emoji_metadata.json', output_file='data/
     }
 
     for emoji in fully_qualified:
-        name = emoji['name'].lower()
-
-        if 'face' in name or 'smile' in name or 'grin' in name:
-            categories['faces'].append(emoji)
-        elif 'hand' in name or 'finger' in name or 'fist' in name:
-            categories['hands'].append(emoji)
-        elif any(word in name for word in ['cat', 'dog', 'bird', 'animal', 'monkey', 'bear', 'lion']):
-            categories['animals'].append(emoji)
-        elif any(word in name for word in ['food', 'fruit', 'pizza', 'burger', 'coffee']):
-            categories['food'].append(emoji)
-        elif 'flag' in name:
-            categories['flags'].append(emoji)
-        elif any(word in name for word in ['heart', 'star', 'circle', 'square', 'triangle', 'arrow']):
-            categories['symbols'].append(emoji)
-        elif any(word in name for word in ['phone', 'computer', 'book', 'pen', 'car', 'house']):
-            categories['objects'].append(emoji)
-        else:
-            categories['other'].append(emoji)
+        # Metadata from older scrapes has no precomputed lowercase name
+        name = emoji.get('name_lower') or emoji['name'].lower()
+
+        cat = next((cat for cat, pattern in _NAME_RULES if pattern.search(name)), 'other')
+        categories[cat].append(emoji)
 
     print("\nCategory distribution:")
     for cat, items in categories.items():
@@ -83,10 +82,18 @@ def select_test_sample(input_file='data/emoji_metadata.json', output_file='data/
         'cat face', 'cat',  # 🐱🐈
     ]
 
+    # First entry per name, and the identities already sampled, so each
+    # confusable is one dict lookup rather than two list scans
+    by_name = {}
+    for e in fully_qualified:
+        by_name.setdefault(e['name'], e)
+    sampled = {id(e) for e in sample}
+
     for name in confusable_names:
-        matching = [e for e in fully_qualified if e['name'] == name]
-        if matching and matching[0] not in sample:
-            sample.append(matching[0])
+        e = by_name.get(name)
+        if e is not None and id(e) not in sampled:
+            sample.append(e)
+            sampled.add(id(e))
 
     print(f"Sample size with confusables: {len(sample)}")
 
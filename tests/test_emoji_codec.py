@@ -0,0 +1,255 @@
+"""
+EmojiCodec must keep the results of the original reference codec: the
+tokenizer, Base58 decoder and decode fast path have all been rewritten
+for speed, so they are checked here against the straightforward versions
+"""
+
+import pickle
+import random
+from pathlib import Path
+
+import pytest
+
+from emoji_codec import EmojiCodec, _base58_decode, _decode_emoji, split_emoji
+
+
+DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+DISTINCT_MAPPING = str(DATA_DIR / 'base58_emoji_mapping.json')
+STEGO_MAPPING = str(DATA_DIR / 'base58_emoji_mapping_stego.json')
+
+GENESIS = '1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa'
+P2SH = '3J98t1WpEZ73CNmYviecrnyiWrnqRhWNLy'
+BASE58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+
+# Encodings produced by the original codec
+GOLDEN = {
+    DISTINCT_MAPPING: {
+        GENESIS: '🧔🤶🧔🐞🥝🧔🫅🥝🤚🦪🍁🫅🤴🕸️🤫🍎🍏🥝🌸🤴🌸🍈🤚🫑🍈👱👦👊🍎🕸️👦🤴😶🐣',
+        P2SH: '🍊👩👴👶🖖🧔👋✊🪲👨👊🍊👏😶👱👧👦🕸️🫅🖐️🧒👲🐵🕸️👋🧒👲🍑🤲🫰👋😶🍈🐵',
+    },
+    STEGO_MAPPING: {
+        GENESIS: '😂😌😂🥺🤔😂🤣🤔🎁🙃⭐🤣✨🙏🌺🎊🥳🤔🌸✨🌸😎🎁😬😎😄😇🍊🎊🙏😇✨🤞🤷',
+        P2SH: '❤️🌟🙌☕🍀😂🥹😊🤩😉🍊❤️🎵🤞😄🔥😇🙏🤣🎈🤗💯😘🙏🥹🤗💯😅🍕🐱🥹🤞😎😘',
+    },
+}
+
+MAPPINGS = list(GOLDEN)
+
+
+def reference_split_emoji(emoji_string):
+    """The original character-by-character tokenizer"""
+    emoji_list = []
+    i = 0
+
+    while i < len(emoji_string):
+        emoji = emoji_string[i]
+        i += 1
+
+        while i < len(emoji_string) and emoji_string[i] in ['\uFE0F', '\uFE0E']:
+            emoji += emoji_string[i]
+            i += 1
+
+        while i < len(emoji_string) and '\U0001F3FB' <= emoji_string[i] <= '\U0001F3FF':
+            emoji += emoji_string[i]
+            i += 1
+
+        while i < len(emoji_string) and emoji_string[i] == '\u200D':
+            emoji += emoji_string[i]
+            i += 1
+            if i < len(emoji_string):
+                emoji += emoji_string[i]
+                i += 1
+
+        emoji_list.append(emoji)
+
+    return emoji_list
+
+
+def reference_base58_decode(address):
+    """The original one-digit-at-a-time Base58 decoder"""
+    decoded = 0
+    for char in address:
+        decoded = decoded * 58 + BASE58_ALPHABET.index(char)
+
+    result = decoded.to_bytes((decoded.bit_length() + 7) // 8, byteorder='big')
+    num_leading_ones = len(address) - len(address.lstrip('1'))
+    return b'\x00' * num_leading_ones + result
+
+
+@pytest.fixture(scope='module', params=MAPPINGS, ids=['distinct', 'stego'])
+def codec(request):
+    return EmojiCodec(request.param, verbose=False)
+
+
+@pytest.mark.parametrize('address', [GENESIS, P2SH])
+def test_encode_decode_golden(codec, address):
+    emoji_address = GOLDEN[codec.mapping_file][address]
+
+    assert codec.encode(address) == (emoji_address, True)
+    assert codec.encode_many([address, address]) == [(emoji_address, True)] * 2
+    assert codec.decode(emoji_address) == (address, True)
+
+
+def test_scan_golden(codec):
+    result = codec.scan(GOLDEN[codec.mapping_file][GENESIS])
+
+    assert result['base58'] == GENESIS
+    assert result['decode_success'] and result['checksum_valid']
+    assert result['errors'] == ['✓ Checksum valid']
+
+
+def test_scan_bad_checksum(codec):
+    emoji_address, _ = codec.encode(GENESIS[:-1] + 'b')
+    result = codec.scan(emoji_address)
+
+    assert result['decode_success'] and not result['checksum_valid']
+    assert result['errors'] == [
+        'Checksum validation failed: Checksum mismatch (expected c29b7d93, got c29b7d94)'
+    ]
+
+
+def test_extract_golden(codec):
+    emoji_address = GOLDEN[codec.mapping_file][GENESIS]
+    text = f"Hey! {emoji_address} bye"
+
+    assert codec.extract_from_text(text) == [{
+        'text': text,
+        'extracted_emoji': emoji_address,
+        'base58': GENESIS,
+        'decode_success': True,
+        'checksum_valid': True,
+        'errors': ['✓ Checksum valid - Address found!'],
+        'start_index': 0,
+    }]
+
+
+def test_unknown_input(codec):
+    assert codec.encode('0OIl') == ('❓❓❓❓', False)
+
+    base58_address, success = codec.decode('🧱')
+    assert (base58_address, success) == ('?', False)
+
+
+def test_encode_tokens(codec):
+    address = GENESIS[:5] + '0' + GENESIS[5:]  # '0' is not Base58
+    tokens = codec.encode_tokens(address)
+
+    assert len(tokens) == len(address)
+    assert tokens[5] == '❓'
+    assert tokens[:5] + tokens[6:] == [codec.mapping[char]['emoji'] for char in GENESIS]
+    assert ''.join(tokens) == codec.encode(address)[0]
+
+
+def test_extract_from_texts_matches_extract_from_text(codec):
+    emoji_address = GOLDEN[codec.mapping_file][GENESIS]
+    texts = [f"Hey! {emoji_address}", "no emoji here", emoji_address[:10]]
+
+    assert (codec.extract_from_texts(texts, max_workers=2)
+            == [codec.extract_from_text(text) for text in texts])
+
+
+def test_codecs_do_not_share_mapping():
+    first = EmojiCodec(DISTINCT_MAPPING, verbose=False)
+    expected = first.encode('1')
+    first.mapping['1']['emoji'] = 'X'
+
+    assert EmojiCodec(DISTINCT_MAPPING, verbose=False).encode('1') == expected
+
+
+def test_long_inputs_are_not_cached():
+    codec = EmojiCodec(DISTINCT_MAPPING, verbose=False)
+    emoji_address = GOLDEN[DISTINCT_MAPPING][GENESIS]
+    document = emoji_address * 10 + '\u200D'  # too long to cache, and not fast-pathed
+    split_emoji.cache_clear()
+
+    codec.scan(emoji_address)
+    codec.scan(document)
+
+    assert codec._decode_cached.cache_info().currsize == 1
+    assert codec._validate_checksum_cached.cache_info().currsize == 1
+    assert split_emoji.cache_info().currsize <= 1
+
+
+def test_extract_from_stream_matches_extract_from_text(codec):
+    # Stego P2SH starts with a VS16 emoji; the ZWJ family follows it
+    text = f"Hi {GOLDEN[codec.mapping_file][P2SH]} and 👨\u200D👩\u200D👧 bye ❤\uFE0F"
+
+    expected = codec.extract_from_text(text)
+    for result in expected:
+        result['text'] = None
+
+    # Every split point, including between an emoji and its selector and
+    # inside the ZWJ sequence
+    for cut in range(len(text) + 1):
+        assert codec.extract_from_stream([text[:cut], text[cut:]]) == expected
+
+    assert codec.extract_from_stream(iter(text)) == expected
+
+
+def test_codec_pickles(codec):
+    restored = pickle.loads(pickle.dumps(codec))
+    emoji_address = GOLDEN[codec.mapping_file][GENESIS]
+
+    assert restored.scan(emoji_address) == codec.scan(emoji_address)
+
+
+@pytest.mark.parametrize('emoji_string, expected', [
+    ('', []),
+    ('😀😂', ['😀', '😂']),
+    ('❤\uFE0F😀', ['❤\uFE0F', '😀']),  # VS16
+    ('☺\uFE0E😀', ['☺\uFE0E', '😀']),  # VS15
+    ('👍🏽👍', ['👍🏽', '👍']),  # skin tone
+    ('👨\u200D👩\u200D👧😀', ['👨\u200D👩\u200D👧', '😀']),  # ZWJ chain
+    ('🏳\uFE0F\u200D🌈', ['🏳\uFE0F\u200D🌈']),  # VS16 then ZWJ
+    ('👩🏽\u200D💻', ['👩🏽\u200D💻']),  # skin tone then ZWJ
+    ('😀\u200D', ['😀\u200D']),  # trailing ZWJ
+    ('😀\u200D\u200D😂', ['😀\u200D\u200D', '😂']),  # ZWJ+ZWJ
+    ('\U0001F3FD😀', ['\U0001F3FD', '😀']),  # stray modifier
+    ('\uFE0F\uFE0F😀', ['\uFE0F\uFE0F', '😀']),  # stray selectors
+    ('\u200D😀', ['\u200D', '😀']),  # leading ZWJ
+    ('a\nb', ['a', '\n', 'b']),
+])
+def test_split_emoji_cases(emoji_string, expected):
+    assert list(split_emoji(emoji_string)) == expected
+    assert reference_split_emoji(emoji_string) == expected
+
+
+def test_split_emoji_matches_reference_on_random_strings():
+    rng = random.Random(0)
+    alphabet = ['😀', '❤', '👍', 'a', '\n', '\uFE0E', '\uFE0F', '\u200D',
+                '\U0001F3FB', '\U0001F3FF']
+
+    for _ in range(5000):
+        emoji_string = ''.join(rng.choices(alphabet, k=rng.randrange(12)))
+        assert list(split_emoji(emoji_string)) == reference_split_emoji(emoji_string)
+
+
+def test_decode_fast_path_matches_split_emoji(codec):
+    rng = random.Random(1)
+    # Mapped emoji (single and multi-codepoint), unmapped emoji and bare
+    # cluster continuations, so inputs both take and miss the fast path
+    alphabet = list(codec.reverse_mapping) + ['🧱', '\uFE0F', '\u200D', '\U0001F3FD']
+
+    for _ in range(5000):
+        emoji_address = ''.join(rng.choices(alphabet, k=rng.randrange(40)))
+        tokens = reference_split_emoji(emoji_address)
+        expected = (
+            ''.join(codec.reverse_mapping.get(emoji, '?') for emoji in tokens),
+            tuple(emoji for emoji in tokens if emoji not in codec.reverse_mapping),
+        )
+
+        assert _decode_emoji(codec.reverse_mapping, codec._decode_table,
+                             codec._single_codepoint_emoji, emoji_address) == expected
+
+
+@pytest.mark.parametrize('length', range(61))
+def test_base58_decode_matches_reference(length):
+    rng = random.Random(length)
+    b58_values = {char: i for i, char in enumerate(BASE58_ALPHABET)}
+
+    for leading_ones in sorted({0, min(1, length), length // 2, length}):
+        for _ in range(20):
+            address = '1' * leading_ones + ''.join(
+                rng.choices(BASE58_ALPHABET, k=length - leading_ones)
+            )
+            assert _base58_decode(b58_values, address) == reference_base58_decode(address)
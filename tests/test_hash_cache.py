@@ -0,0 +1,105 @@
+"""
+The perceptual hash cache is shared between runs: analyzers over other
+image directories, or over fewer emoji, must not throw away each other's
+entries, while entries for deleted images are dropped
+"""
+
+import json
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import visual_similarity
+from visual_similarity import EmojiSimilarityAnalyzer
+
+
+EMOJI = [
+    {'emoji': chr(0x1F600 + i), 'codepoint': f'{0x1F600 + i:X}', 'name': f'emoji {i}',
+     'status': 'fully-qualified'}
+    for i in range(4)
+]
+
+
+@pytest.fixture
+def hashed_files(monkeypatch):
+    """Paths of every image file actually hashed (not served from cache)"""
+    hashed = []
+    hash_image_batch = visual_similarity._hash_image_batch
+
+    def counting_hash_image_batch(filepaths):
+        hashed.extend(filepaths)
+        return hash_image_batch(filepaths)
+
+    monkeypatch.setattr(visual_similarity, '_hash_image_batch', counting_hash_image_batch)
+    return hashed
+
+
+def make_analyzer(tmp_path, images_dir, seed):
+    """Analyzer over images_dir, filled with random images, sharing tmp_path's cache"""
+    metadata = tmp_path / 'emoji_metadata.json'
+    metadata.write_text(json.dumps(EMOJI))
+    analyzer = EmojiSimilarityAnalyzer(metadata, tmp_path / images_dir,
+                                       hash_cache_file=tmp_path / 'cache.json')
+
+    rng = np.random.default_rng(seed)
+    for emoji in EMOJI:
+        pixels = rng.integers(0, 256, size=(32, 32, 4), dtype=np.uint8)
+        Image.fromarray(pixels, 'RGBA').save(analyzer._get_emoji_filepath(emoji))
+
+    return analyzer
+
+
+def cached_paths(tmp_path):
+    with open(tmp_path / 'cache.json', encoding='utf-8') as f:
+        return set(json.load(f)['entries'])
+
+
+def test_analyzers_over_two_dirs_share_the_cache(tmp_path, hashed_files):
+    a = make_analyzer(tmp_path, 'a', seed=0)
+    b = make_analyzer(tmp_path, 'b', seed=1)
+
+    hashes_a = a.compute_perceptual_hashes(EMOJI)
+    b.compute_perceptual_hashes(EMOJI)
+    assert len(hashed_files) == 2 * len(EMOJI)
+
+    assert a.compute_perceptual_hashes(EMOJI) == hashes_a
+    assert b.compute_perceptual_hashes(EMOJI)
+    assert len(hashed_files) == 2 * len(EMOJI)
+    assert len(cached_paths(tmp_path)) == 2 * len(EMOJI)
+
+
+def test_subset_run_keeps_other_entries(tmp_path, hashed_files):
+    analyzer = make_analyzer(tmp_path, 'images', seed=0)
+
+    hashes = analyzer.compute_perceptual_hashes(EMOJI)
+    analyzer.compute_perceptual_hashes(EMOJI[:1])
+
+    assert analyzer.compute_perceptual_hashes(EMOJI) == hashes
+    assert len(hashed_files) == len(EMOJI)
+
+
+def test_deleted_images_are_pruned(tmp_path, hashed_files):
+    analyzer = make_analyzer(tmp_path, 'images', seed=0)
+    analyzer.compute_perceptual_hashes(EMOJI)
+
+    deleted = analyzer._get_emoji_filepath(EMOJI[0])
+    deleted.unlink()
+    analyzer.compute_perceptual_hashes(EMOJI[1:2])
+
+    assert str(deleted.resolve()) not in cached_paths(tmp_path)
+    assert len(cached_paths(tmp_path)) == len(EMOJI) - 1
+
+
+def test_cache_from_other_settings_is_ignored(tmp_path, hashed_files):
+    analyzer = make_analyzer(tmp_path, 'images', seed=0)
+    hashes = analyzer.compute_perceptual_hashes(EMOJI)
+
+    with open(tmp_path / 'cache.json', encoding='utf-8') as f:
+        data = json.load(f)
+    data['params']['hash_size'] = 16
+    with open(tmp_path / 'cache.json', 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+    assert analyzer.compute_perceptual_hashes(EMOJI) == hashes
+    assert len(hashed_files) == 2 * len(EMOJI)
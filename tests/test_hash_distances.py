@@ -0,0 +1,119 @@
+"""
+The tiled, threaded pairwise sweep behind find_confusable_pairs and
+calculate_distinctiveness_scores must give the same answers as comparing
+every pair of ImageHashes with calculate_hash_similarity
+"""
+
+import numpy as np
+import pytest
+from imagehash import ImageHash
+
+import visual_similarity
+from visual_similarity import HASH_TYPES, EmojiSimilarityAnalyzer, _popcount_by_table, popcount
+
+
+def int_to_hash(value):
+    """Inverse of hash_to_int: a 64-bit integer as an 8 x 8 ImageHash"""
+    bits = np.unpackbits(np.frombuffer(int(value).to_bytes(8, 'big'), dtype=np.uint8))
+    return ImageHash(bits.astype(bool).reshape(8, 8))
+
+
+def tie_heavy_hash_matrix(rng, n):
+    """
+    Hashes that are few-bit variations of a handful of bases, so many
+    pairs fall under the confusable threshold and many distances tie
+    """
+    bases = rng.integers(0, 2**63, size=(4, len(HASH_TYPES)), dtype=np.uint64)
+    matrix = bases[rng.integers(0, len(bases), size=n)]
+
+    for row in matrix:
+        for col in range(len(HASH_TYPES)):
+            for bit in rng.integers(0, 64, size=rng.integers(0, 4)):
+                row[col] ^= np.uint64(1) << np.uint64(bit)
+
+    return matrix
+
+
+@pytest.fixture
+def analyzer(tmp_path):
+    metadata = tmp_path / 'emoji_metadata.json'
+    metadata.write_text('[]')
+    analyzer = EmojiSimilarityAnalyzer(metadata, tmp_path / 'images', hash_cache_file=None)
+
+    rng = np.random.default_rng(0)
+    analyzer.hash_matrix = tie_heavy_hash_matrix(rng, 70)
+    analyzer.hash_ids = [f'emoji{i}' for i in range(len(analyzer.hash_matrix))]
+    analyzer.hashes = {
+        emoji_id: {t: int_to_hash(v) for t, v in zip(HASH_TYPES, row)}
+        for emoji_id, row in zip(analyzer.hash_ids, analyzer.hash_matrix)
+    }
+    return analyzer
+
+
+def brute_force_similarity(analyzer, emoji1, emoji2):
+    """Average similarity over all hash types, one pair at a time"""
+    return np.mean([
+        analyzer.calculate_hash_similarity(analyzer.hashes[emoji1][t], analyzer.hashes[emoji2][t])
+        for t in HASH_TYPES
+    ])
+
+
+def brute_force_confusable_pairs(analyzer, threshold):
+    emoji_list = list(analyzer.hashes)
+    pairs = []
+
+    for i, emoji1 in enumerate(emoji_list):
+        for emoji2 in emoji_list[i + 1:]:
+            similarity = brute_force_similarity(analyzer, emoji1, emoji2)
+            if similarity < threshold:
+                pairs.append((emoji1, emoji2, similarity))
+
+    pairs.sort(key=lambda x: x[2])
+    return pairs
+
+
+def brute_force_distinctiveness(analyzer):
+    return {
+        emoji1: np.mean([brute_force_similarity(analyzer, emoji1, emoji2)
+                         for emoji2 in analyzer.hashes if emoji2 != emoji1])
+        for emoji1 in analyzer.hashes
+    }
+
+
+@pytest.mark.parametrize('cpu_count', [1, 4], ids=['serial', 'threaded'])
+@pytest.mark.parametrize('tile_size', [7, 16, 256])
+def test_sweep_matches_brute_force(analyzer, monkeypatch, cpu_count, tile_size):
+    monkeypatch.setattr(visual_similarity, 'HASH_TILE_SIZE', tile_size)
+    monkeypatch.setattr(visual_similarity.os, 'cpu_count', lambda: cpu_count)
+    threshold = 0.15
+
+    expected_pairs = brute_force_confusable_pairs(analyzer, threshold)
+    expected_scores = brute_force_distinctiveness(analyzer)
+
+    pairs = analyzer.find_confusable_pairs(threshold=threshold)
+    scores = analyzer.calculate_distinctiveness_scores()
+
+    assert expected_pairs  # the data must actually exercise the threshold and ties
+    assert [(e1, e2) for e1, e2, _ in pairs] == [(e1, e2) for e1, e2, _ in expected_pairs]
+    assert [sim for _, _, sim in pairs] == pytest.approx([sim for _, _, sim in expected_pairs])
+    assert list(scores) == list(expected_scores)
+    assert list(scores.values()) == pytest.approx(list(expected_scores.values()))
+
+
+def test_distinctiveness_without_confusable_pass(analyzer, monkeypatch):
+    monkeypatch.setattr(visual_similarity, 'HASH_TILE_SIZE', 16)
+
+    scores = analyzer.calculate_distinctiveness_scores()
+
+    assert list(scores.values()) == pytest.approx(list(brute_force_distinctiveness(analyzer).values()))
+
+
+@pytest.mark.parametrize('count', [popcount, _popcount_by_table], ids=['popcount', 'table'])
+def test_popcount_matches_bin_count(count):
+    rng = np.random.default_rng(1)
+    x = rng.integers(0, 2**64, size=(5, 7, len(HASH_TYPES)), dtype=np.uint64)
+    x[0, 0] = [0, 2**64 - 1, 1, 2**63]
+
+    expected = np.vectorize(lambda v: bin(int(v)).count('1'))(x)
+
+    assert np.array_equal(count(x), expected)
@@ -0,0 +1,61 @@
+"""
+batch_whash must reproduce imagehash.whash bit for bit: it reimplements
+whash's wavelet steps, so an imagehash upgrade could make them drift
+"""
+
+import imagehash
+import numpy as np
+import pytest
+from PIL import Image
+
+from visual_similarity import batch_whash
+
+
+def random_images(rng, count, size, mode='RGBA'):
+    """Uniform noise images of the given size"""
+    channels = len(mode)
+    return [
+        Image.fromarray(rng.integers(0, 256, size=(size[1], size[0], channels), dtype=np.uint8), mode)
+        for _ in range(count)
+    ]
+
+
+def binary_noise_images(rng, count, size):
+    """Black and white noise: many pixels tie with the median"""
+    return [
+        Image.fromarray((rng.integers(0, 2, size=(size[1], size[0])) * 255).astype(np.uint8), 'L').convert('RGBA')
+        for _ in range(count)
+    ]
+
+
+def constant_images(size):
+    """Flat images, whose wavelet coefficients are all zero"""
+    return [Image.new('RGBA', size, color) for color in
+            [(0, 0, 0, 255), (255, 255, 255, 255), (128, 64, 32, 255), (0, 0, 0, 0)]]
+
+
+@pytest.mark.parametrize('size', [(64, 64), (72, 72), (100, 50)])
+def test_batch_whash_matches_whash(size):
+    rng = np.random.default_rng(0)
+    images = (random_images(rng, 8, size)
+              + binary_noise_images(rng, 8, size)
+              + constant_images(size))
+
+    assert batch_whash(images) == [imagehash.whash(img) for img in images]
+
+
+@pytest.mark.parametrize('hash_size', [4, 16])
+def test_batch_whash_matches_whash_hash_size(hash_size):
+    rng = np.random.default_rng(1)
+    images = random_images(rng, 4, (64, 64)) + binary_noise_images(rng, 4, (64, 64))
+
+    assert (batch_whash(images, hash_size=hash_size)
+            == [imagehash.whash(img, hash_size=hash_size) for img in images])
+
+
+def test_batch_whash_single_and_empty():
+    rng = np.random.default_rng(2)
+    image, = random_images(rng, 1, (64, 64))
+
+    assert batch_whash([image]) == [imagehash.whash(image)]
+    assert batch_whash([]) == []
@@ -14,35 +14,202 @@ Uses multiple similarity metrics:
 - Color histogram comparison
 """
 
+import hashlib
 import json
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Tuple, Set
 import imagehash
 from PIL import Image
 import numpy as np
+import pywt
 from skimage.metrics import structural_similarity as ssim
 
+from download_test_images import download_concurrently, fetch_image, get_image_filename, twemoji_urls
+
+
+# Hash types computed per emoji, in hash-matrix column order
+HASH_TYPES = ('dhash', 'phash', 'ahash', 'whash')
+
+# Size images are resized to before hashing, and bits per side of each hash
+# (hash_to_int and the distance math assume 8 x 8 = 64-bit hashes)
+HASH_IMAGE_SIZE = (64, 64)
+HASH_SIZE = 8
+
+# Bump when the hash cache layout or the hashing pipeline changes in a way
+# the other cache parameters don't capture
+HASH_CACHE_VERSION = 1
+
+# Set bits per byte value, for counting differing bits in XORed hashes
+_POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def popcount(x: np.ndarray) -> np.ndarray:
+    """
+    Count set bits in each element of a uint64 array
+
+    Uses numpy's native bitwise_count (hardware POPCNT, numpy >= 2.0) when
+    available, else a per-byte table lookup
+    """
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(x)
+    return _popcount_by_table(x)
+
+
+def _popcount_by_table(x: np.ndarray) -> np.ndarray:
+    """popcount for numpy < 2.0: sum a table lookup over each element's bytes"""
+    return _POPCOUNT_TABLE[x.view(np.uint8)].reshape(x.shape + (8,)).sum(axis=-1, dtype=np.uint8)
+
+
+# Codepoints of emoji the analysis skips: flags (regional indicators
+# U+1F1E6 - U+1F1FF, so a leading 1F1), skin tone modifiers
+# (U+1F3FB - U+1F3FF), ZWJ sequences (U+200D) and keycaps (U+20E3)
+_PROBLEMATIC_CODEPOINT_RE = re.compile(r'^1F1|1F3F[B-F]|200D|20E3')
+
+# Lowercased names of emoji the analysis skips
+_PROBLEMATIC_NAME_RE = re.compile(r'flag|keycap')
+
+# Emoji per side of the square tiles the pairwise hash distances are
+# computed in: a 256 x 256 x 4 uint64 XOR is 2 MB
+HASH_TILE_SIZE = 256
+
+# Below this many images to hash, starting worker processes costs more
+# than it saves
+MIN_IMAGES_FOR_POOL = 64
+
+# Images hashed together per call: lets the wavelet transforms for wHash
+# run over a whole stack of images at once
+HASH_BATCH_SIZE = 32
+
+
+def hash_to_int(h: imagehash.ImageHash) -> int:
+    """Pack a 64-bit ImageHash into an integer, first hash bit highest"""
+    return int.from_bytes(np.packbits(h.hash.flatten()).tobytes(), 'big')
+
+
+def preprocess_image(filepath: Path, size=(64, 64)) -> Image.Image:
+    """Load an emoji image as RGBA, resized to a standard size"""
+    if not filepath.exists():
+        raise FileNotFoundError(f"Image not found: {filepath}")
+
+    # Load and resize image
+    img = Image.open(filepath)
+
+    # Convert to RGBA if not already
+    if img.mode != 'RGBA':
+        img = img.convert('RGBA')
+
+    # Resize to standard size
+    img = img.resize(size, Image.Resampling.LANCZOS)
+
+    return img
+
+
+def batch_whash(images: List[Image.Image], hash_size=8) -> List[imagehash.ImageHash]:
+    """
+    imagehash.whash with its defaults for a list of same-sized images
+
+    Runs each PyWavelets transform once over the stacked images instead of
+    once per image. Every image still goes through the same per-row and
+    per-column arithmetic, so the hashes are bit-identical to whash.
+    """
+    if not images:
+        return []
+
+    image_scale = max(2**int(np.log2(min(images[0].size))), hash_size)
+    ll_max_level = int(np.log2(image_scale))
+    dwt_level = ll_max_level - int(np.log2(hash_size))
+
+    pixels = np.stack([
+        np.asarray(img.convert('L').resize((image_scale, image_scale), Image.Resampling.LANCZOS))
+        for img in images
+    ]) / 255.
+
+    # Remove the lowest low level (LL) frequency, as whash does by default
+    coeffs = list(pywt.wavedec2(pixels, 'haar', level=ll_max_level, axes=(1, 2)))
+    coeffs[0] *= 0
+    pixels = pywt.waverec2(coeffs, 'haar', axes=(1, 2))
+
+    dwt_low = pywt.wavedec2(pixels, 'haar', level=dwt_level, axes=(1, 2))[0]
+    med = np.median(dwt_low.reshape(len(images), -1), axis=1)
+
+    return [imagehash.ImageHash(diff) for diff in dwt_low > med[:, None, None]]
+
+
+def _hash_cache_params() -> Dict:
+    """Everything that determines the hashes stored in the hash cache"""
+    return {
+        'version': HASH_CACHE_VERSION,
+        'hash_types': list(HASH_TYPES),
+        'image_size': list(HASH_IMAGE_SIZE),
+        'hash_size': HASH_SIZE,
+        'imagehash': imagehash.__version__,
+    }
+
+
+def _hash_image_batch(filepaths: List[Path]) -> List[Tuple]:
+    """
+    Load and hash a batch of image files; runs in worker processes
+
+    Returns:
+        One (hashes, image, None) on success or (None, None, error)
+        otherwise, per file
+    """
+    results = []
+    loaded = []  # (position in results, image)
+
+    for filepath in filepaths:
+        try:
+            loaded.append((len(results), preprocess_image(filepath, HASH_IMAGE_SIZE)))
+            results.append(None)
+        except Exception as e:
+            results.append((None, None, str(e)))
+
+    whashes = batch_whash([img for _, img in loaded], hash_size=HASH_SIZE)
+
+    for (i, img), whash in zip(loaded, whashes):
+        results[i] = ({
+            'dhash': imagehash.dhash(img, hash_size=HASH_SIZE),
+            'phash': imagehash.phash(img, hash_size=HASH_SIZE),
+            'ahash': imagehash.average_hash(img, hash_size=HASH_SIZE),
+            'whash': whash,  # Wavelet hash
+        }, img, None)
+
+    return results
+
 
 class EmojiSimilarityAnalyzer:
     """Analyzes visual similarity between emoji"""
 
     def __init__(self, emoji_metadata_file='data/emoji_metadata.json',
-                 images_dir='data/emoji_images'):
-        """Initialize analyzer with emoji metadata and image directory"""
+                 images_dir='data/emoji_images',
+                 hash_cache_file='data/hash_cache.json'):
+        """
+        Initialize analyzer with emoji metadata and image directory
+
+        Perceptual hashes are cached in hash_cache_file between runs;
+        pass None to always recompute them
+        """
 
         with open(emoji_metadata_file, 'r', encoding='utf-8') as f:
             self.all_emoji = json.load(f)
 
         self.images_dir = Path(images_dir)
         self.images_dir.mkdir(parents=True, exist_ok=True)
+        self.hash_cache_file = Path(hash_cache_file) if hash_cache_file else None
 
         # Filter to fully-qualified emoji only
         self.emoji_list = [e for e in self.all_emoji if e['status'] == 'fully-qualified']
 
         # Storage for computed data
-        self.hashes = {}  # emoji_id -> {dhash, phash, ahash}
-        self.images = {}  # emoji_id -> PIL Image
+        self.hashes = {}  # emoji_id -> {dhash, phash, ahash, whash}
+        self.hash_ids = []  # row index -> emoji_id
+        self.hash_matrix = np.empty((0, len(HASH_TYPES)), dtype=np.uint64)  # (N, 4) packed hashes
+        self._filepaths = {}  # (codepoint, name) -> image Path
+        self.distance_totals = None  # (N,) summed hash distance to all others, set by a sweep
+        self.images = {}  # emoji_id -> PIL Image, for emoji hashed this run (not cache hits)
         self.similarity_matrix = {}  # (id1, id2) -> similarity_score
 
     def _get_emoji_filepath(self, emoji: Dict) -> Path:
@@ -55,10 +222,23 @@ class EmojiSimilarityAnalyzer:
         Returns:
             Path to the emoji image file
         """
-        codepoint = emoji['codepoint'].replace(' ', '-').lower()
-        safe_name = emoji['name'].replace('/', '-').replace(' ', '_')
-        filename = f"{codepoint}_{safe_name}.png"
-        return self.images_dir / filename
+        # Every pipeline step looks up the same emoji, so build each path once
+        key = (emoji['codepoint'], emoji['name'])
+        filepath = self._filepaths.get(key)
+
+        if filepath is None:
+            _, filename = get_image_filename(emoji)
+            filepath = self._filepaths[key] = self.images_dir / filename
+
+        return filepath
+
+    def existing_image_names(self) -> Set[str]:
+        """
+        Filenames currently in the image directory, from one directory scan,
+        so callers can test for many images without a stat call per emoji
+        """
+        with os.scandir(self.images_dir) as entries:
+            return {entry.name for entry in entries}
 
     def filter_problematic_emoji(self) -> List[Dict]:
         """
@@ -68,29 +248,13 @@ class EmojiSimilarityAnalyzer:
         - ZWJ sequences (complex emoji)
         - Regional indicators
         """
-        filtered = []
-
-        for emoji in self.emoji_list:
-            name = emoji['name'].lower()
-            codepoint = emoji['codepoint']
-
-            # Skip skin tone modifiers (U+1F3FB - U+1F3FF)
-            if any(tone in codepoint for tone in ['1F3FB', '1F3FC', '1F3FD', '1F3FE', '1F3FF']):
-                continue
-
-            # Skip flags (regional indicators U+1F1E6 - U+1F1FF)
-            if 'flag' in name or codepoint.startswith('1F1'):
-                continue
-
-            # Skip ZWJ sequences (contain U+200D)
-            if '200D' in codepoint:
-                continue
-
-            # Skip keycap sequences
-            if 'keycap' in name or '20E3' in codepoint:
-                continue
-
-            filtered.append(emoji)
+        # One regex search over each codepoint and name instead of a
+        # substring scan per pattern
+        filtered = [
+            emoji for emoji in self.emoji_list
+            if not _PROBLEMATIC_CODEPOINT_RE.search(emoji['codepoint'])
+            and not _PROBLEMATIC_NAME_RE.search(emoji['name'].lower())
+        ]
 
         print(f"Filtered {len(self.emoji_list)} -> {len(filtered)} emoji")
         print(f"Removed {len(self.emoji_list) - len(filtered)} problematic emoji")
@@ -102,69 +266,37 @@ class EmojiSimilarityAnalyzer:
         Download emoji images from Twemoji CDN
         Returns number of successfully downloaded images
         """
-        import requests
-
         downloaded = 0
         failed = []
         total = len(emoji_list) if max_download is None else min(max_download, len(emoji_list))
 
         print(f"\nDownloading {total} emoji images from Twemoji...")
 
-        for i, emoji in enumerate(emoji_list[:total]):
-            if i % 50 == 0 and i > 0:
-                print(f"  Progress: {i}/{total} ({100*i//total}%)")
-
-            # Convert codepoint to format needed for Twemoji
-            codepoint = emoji['codepoint'].replace(' ', '-').lower()
-
-            # Try both 72x72 and svg formats
-            urls = [
-                f"https://cdn.jsdelivr.net/gh/twitter/twemoji@latest/assets/72x72/{codepoint}.png",
-                f"https://cdn.jsdelivr.net/gh/twitter/twemoji@latest/assets/svg/{codepoint}.svg",
-            ]
+        to_fetch = []
+        existing = self.existing_image_names()
 
+        for emoji in emoji_list[:total]:
             # Get filepath using helper method
             filepath = self._get_emoji_filepath(emoji)
 
             # Skip if already downloaded
-            if filepath.exists():
+            if filepath.name in existing:
                 downloaded += 1
-                continue
+            else:
+                to_fetch.append((emoji, filepath))
+
+        results = download_concurrently(
+            lambda session, item: self._fetch_emoji_image(session, *item), to_fetch
+        )
+
+        for i, ((emoji, _), success) in enumerate(zip(to_fetch, results), 1):
+            if i % 50 == 0:
+                print(f"  Progress: {i}/{len(to_fetch)} ({100*i//len(to_fetch)}%)")
 
-            success = False
-            for url in urls:
-                try:
-                    response = requests.get(url, timeout=10)
-                    response.raise_for_status()
-
-                    # Save the image
-                    with open(filepath, 'wb') as f:
-                        f.write(response.content)
-
-                    downloaded += 1
-                    success = True
-                    break
-
-                except Exception as e:
-                    continue
-
-            if not success:
-                # Try without variation selector FE0F
-                if 'fe0f' in codepoint:
-                    alt_codepoint = codepoint.replace('-fe0f', '')
-                    alt_url = f"https://cdn.jsdelivr.net/gh/twitter/twemoji@latest/assets/72x72/{alt_codepoint}.png"
-                    try:
-                        response = requests.get(alt_url, timeout=10)
-                        response.raise_for_status()
-                        with open(filepath, 'wb') as f:
-                            f.write(response.content)
-                        downloaded += 1
-                        success = True
-                    except requests.exceptions.RequestException:
-                        pass
-
-                if not success:
-                    failed.append(emoji['emoji'])
+            if success:
+                downloaded += 1
+            else:
+                failed.append(emoji['emoji'])
 
         print(f"\n✅ Downloaded {downloaded}/{total} images")
         if failed:
@@ -172,26 +304,18 @@ class EmojiSimilarityAnalyzer:
 
         return downloaded
 
+    def _fetch_emoji_image(self, session, emoji: Dict, filepath: Path) -> bool:
+        """Download one emoji image to filepath, returning whether it worked"""
+        codepoint, _ = get_image_filename(emoji)
+        success, _ = fetch_image(session, twemoji_urls(codepoint, svg=True), filepath)
+        return success
+
     def load_and_preprocess_image(self, emoji: Dict, size=(64, 64)) -> Image.Image:
         """Load and preprocess emoji image"""
-        filepath = self._get_emoji_filepath(emoji)
-
-        if not filepath.exists():
-            raise FileNotFoundError(f"Image not found: {filepath}")
-
-        # Load and resize image
-        img = Image.open(filepath)
-
-        # Convert to RGBA if not already
-        if img.mode != 'RGBA':
-            img = img.convert('RGBA')
+        return preprocess_image(self._get_emoji_filepath(emoji), size)
 
-        # Resize to standard size
-        img = img.resize(size, Image.Resampling.LANCZOS)
-
-        return img
-
-    def compute_perceptual_hashes(self, emoji_list: List[Dict]) -> Dict:
+    def compute_perceptual_hashes(self, emoji_list: List[Dict],
+                                  max_workers=None) -> Dict:
         """
         Compute multiple perceptual hashes for each emoji
 
@@ -199,40 +323,177 @@ class EmojiSimilarityAnalyzer:
         - dHash (difference hash): Good for finding similar images
         - pHash (perceptual hash): Robust to resizing, color changes
         - aHash (average hash): Fast, good for exact duplicates
+
+        Images not in the hash cache are hashed in a pool of max_workers
+        processes (default: one per CPU) when there are enough of them.
+        Only those images are kept in self.images; emoji whose hashes come
+        from the cache are not loaded at all.
         """
         print("\nComputing perceptual hashes...")
 
         hashes = {}
         failed = []
+        cache = self._load_hash_cache()
+        seen = {}  # cache entries for this run's images
+        found = {}  # position in emoji_list -> hashes
+        pending = []  # (position, filepath, cache key, stamp) of images still to hash
 
         for i, emoji in enumerate(emoji_list):
-            if i % 100 == 0 and i > 0:
-                print(f"  Processed {i}/{len(emoji_list)}")
+            filepath = self._get_emoji_filepath(emoji)
 
             try:
-                img = self.load_and_preprocess_image(emoji)
-
-                # Compute multiple hash types
-                hashes[emoji['emoji']] = {
-                    'dhash': imagehash.dhash(img),
-                    'phash': imagehash.phash(img),
-                    'ahash': imagehash.average_hash(img),
-                    'whash': imagehash.whash(img),  # Wavelet hash
+                st = filepath.stat()
+            except OSError:
+                failed.append((emoji['emoji'], f"Image not found: {filepath}"))
+                continue
+
+            # Reuse hashes from a previous run while the image file is
+            # unchanged (same modification time and size). Keyed on the
+            # resolved path, so analyzers over different images_dirs can
+            # share one cache file without mixing up same-named images.
+            key = str(filepath.resolve())
+            stamp = [st.st_mtime_ns, st.st_size]
+            entry = cache.get(key)
+
+            if entry and entry[:2] == stamp:
+                found[i] = {
+                    hash_type: imagehash.hex_to_hash(hex_hash)
+                    for hash_type, hex_hash in zip(HASH_TYPES, entry[2:])
                 }
+                seen[key] = entry
+            else:
+                pending.append((i, filepath, key, stamp))
+
+        cached = len(found)
+
+        # Byte-identical image files have identical hashes, so only the
+        # first file with each content digest is decoded and hashed
+        first_with_digest = {}  # content digest -> index into unique_paths
+        unique_paths = []
+        slots = []  # pending index -> index into unique_paths
+
+        for _, filepath, _, _ in pending:
+            try:
+                digest = hashlib.sha1(filepath.read_bytes()).digest()
+            except OSError:
+                digest = None  # let the hashing step report the error
+
+            if digest is None or digest not in first_with_digest:
+                if digest is not None:
+                    first_with_digest[digest] = len(unique_paths)
+                slots.append(len(unique_paths))
+                unique_paths.append(filepath)
+            else:
+                slots.append(first_with_digest[digest])
+
+        unique_results = self._hash_image_files(unique_paths, max_workers)
+        results = [unique_results[slot] for slot in slots]
+
+        if len(unique_paths) < len(pending):
+            print(f"  {len(pending) - len(unique_paths)} images are duplicates of others, hashed once")
+
+        for (i, _, key, stamp), (image_hashes, img, error) in zip(pending, results):
+            if error is not None:
+                failed.append((emoji_list[i]['emoji'], error))
+                continue
+
+            found[i] = image_hashes
+            seen[key] = stamp + [str(image_hashes[t]) for t in HASH_TYPES]
 
-                # Store image for later SSIM comparison
-                self.images[emoji['emoji']] = img
+            # Store image for later SSIM comparison (cached emoji have none)
+            self.images[emoji_list[i]['emoji']] = img
 
-            except Exception as e:
-                failed.append((emoji['emoji'], str(e)))
+        # Keep emoji_list order regardless of which images came from cache
+        for i in sorted(found):
+            hashes[emoji_list[i]['emoji']] = found[i]
 
-        print(f"✅ Computed hashes for {len(hashes)} emoji")
+        print(f"✅ Computed hashes for {len(hashes)} emoji ({cached} from cache)")
         if failed:
             print(f"❌ Failed: {len(failed)} emoji")
 
+        # Keep entries for images other runs use (other images_dirs, larger
+        # emoji lists), dropping only those whose file is gone, then rewrite
+        # the cache if that or this run's hashing changed anything
+        updated = {key: entry for key, entry in cache.items()
+                   if key in seen or os.path.exists(key)}
+        updated.update(seen)
+        if updated != cache:
+            self._save_hash_cache(updated)
+
         self.hashes = hashes
+
+        # Pack every hash into one uint64 matrix so pairwise distances can
+        # be computed with array operations instead of per-pair ImageHash math
+        self.hash_ids = list(hashes)
+        self.hash_matrix = np.array(
+            [[hash_to_int(h[t]) for t in HASH_TYPES] for h in hashes.values()],
+            dtype=np.uint64
+        ).reshape(-1, len(HASH_TYPES))
+        self.distance_totals = None
+
         return hashes
 
+    def _hash_image_files(self, filepaths: List[Path], max_workers=None) -> List[Tuple]:
+        """
+        Hash filepaths in batches of HASH_BATCH_SIZE, in worker processes
+        when there are enough files and more than one worker to share them
+
+        Returns one _hash_image_batch result per file, in order. Progress
+        is printed every 100 files or so, as the batches complete.
+        """
+        workers = max_workers or os.cpu_count() or 1
+        batches = [filepaths[i:i + HASH_BATCH_SIZE]
+                   for i in range(0, len(filepaths), HASH_BATCH_SIZE)]
+
+        if workers == 1 or len(filepaths) < MIN_IMAGES_FOR_POOL:
+            return self._collect_hash_batches(map(_hash_image_batch, batches), len(filepaths))
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return self._collect_hash_batches(executor.map(_hash_image_batch, batches),
+                                              len(filepaths))
+
+    def _collect_hash_batches(self, batch_results, total: int) -> List[Tuple]:
+        """Flatten batch results as they arrive, reporting progress"""
+        results = []
+
+        for batch in batch_results:
+            done = len(results)
+            results.extend(batch)
+            if len(results) // 100 > done // 100:
+                print(f"  Processed {len(results)}/{total}")
+
+        return results
+
+    def _load_hash_cache(self) -> Dict[str, list]:
+        """
+        Load cached hashes: resolved image path -> [mtime_ns, size, hex
+        hash per HASH_TYPES entry]. A missing or unreadable cache is empty,
+        as is one written with different hashing parameters (see
+        _hash_cache_params), since its hashes would not be comparable.
+        """
+        if self.hash_cache_file is None:
+            return {}
+
+        try:
+            with open(self.hash_cache_file, 'rb') as f:
+                data = json.loads(f.read())
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict) or data.get('params') != _hash_cache_params():
+            print("  Hash cache was made with different settings; ignoring it")
+            return {}
+
+        return data.get('entries', {})
+
+    def _save_hash_cache(self, cache: Dict[str, list]):
+        """Write the hash cache back to disk, with the parameters it was made with"""
+        if self.hash_cache_file is None:
+            return
+
+        with open(self.hash_cache_file, 'w', encoding='utf-8') as f:
+            json.dump({'params': _hash_cache_params(), 'entries': cache}, f)
+
     def calculate_hash_similarity(self, hash1: imagehash.ImageHash,
                                   hash2: imagehash.ImageHash) -> float:
         """
@@ -246,10 +507,101 @@ class EmojiSimilarityAnalyzer:
         similarity = hamming_distance / 64.0
         return similarity
 
+    def _hash_distance_tile(self, rows: slice, cols: slice) -> np.ndarray:
+        """
+        Total Hamming distance over all hash types between the emoji in
+        rows and those in cols, as a (len(rows), len(cols)) array
+
+        Dividing by 64 * len(HASH_TYPES) gives the same averaged
+        similarity as calculate_hash_similarity over each type
+        """
+        # At most 64 * 4 = 256 bits differ, so uint16 holds every distance
+        # in a quarter of the memory of the default int64
+        xor = self.hash_matrix[rows, None, :] ^ self.hash_matrix[None, cols, :]
+        return popcount(xor).sum(axis=-1, dtype=np.uint16)
+
+    def _hash_distance_tiles(self):
+        """
+        Yield (row_start, col_start, distances) for the square tiles on and
+        above the diagonal of the pairwise distance matrix
+
+        The matrix is symmetric, so the tiles below the diagonal are the
+        transposes of these. Tiles of HASH_TILE_SIZE emoji keep each XOR
+        temporary small enough to stay in cache.
+
+        numpy releases the GIL inside the XOR, popcount and sum loops, so
+        on multi-core machines each row band's tiles are computed in
+        parallel threads; one band is in flight at a time
+        """
+        n = len(self.hash_ids)
+        workers = os.cpu_count() or 1
+
+        def tile(i, j):
+            return self._hash_distance_tile(slice(i, i + HASH_TILE_SIZE),
+                                            slice(j, j + HASH_TILE_SIZE))
+
+        if workers == 1 or n <= HASH_TILE_SIZE:
+            for i in range(0, n, HASH_TILE_SIZE):
+                for j in range(i, n, HASH_TILE_SIZE):
+                    yield i, j, tile(i, j)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for i in range(0, n, HASH_TILE_SIZE):
+                cols = range(i, n, HASH_TILE_SIZE)
+                for j, distances in zip(cols, executor.map(lambda j: tile(i, j), cols)):
+                    yield i, j, distances
+
+    def _sweep_hash_distances(self, threshold=None) -> List[Tuple]:
+        """
+        One pass over the pairwise distance tiles, collecting everything
+        both analyses need so neither has to repeat the O(N^2) work
+
+        Stores each emoji's total distance to all others in
+        self.distance_totals, and returns the (row, col, similarity) pairs
+        with row < col and similarity below threshold (none if threshold
+        is None), in row-major order
+        """
+        found = []
+        scale = 64.0 * len(HASH_TYPES)
+        totals = np.zeros(len(self.hash_ids), dtype=np.int64)
+
+        for row_start, col_start, distances in self._hash_distance_tiles():
+            h, w = distances.shape
+
+            # Each off-diagonal tile also stands in for its transpose
+            totals[row_start:row_start + h] += distances.sum(axis=1, dtype=np.int64)
+            if col_start != row_start:
+                totals[col_start:col_start + w] += distances.sum(axis=0, dtype=np.int64)
+
+            if threshold is None:
+                continue
+
+            # Only pairs above the diagonal (i < j); if too similar, confusable.
+            # Comparing bit counts against threshold * scale is exact (scale
+            # is a power of two) and avoids a float copy of every tile
+            rows = np.arange(row_start, row_start + h)[:, None]
+            cols = np.arange(col_start, col_start + w)[None, :]
+            mask = (cols > rows) & (distances < threshold * scale)
+
+            for i, j in zip(*np.nonzero(mask)):
+                found.append((row_start + i, col_start + j, distances[i, j] / scale))
+
+        # Tiles are visited out of row order; restore it so that equally
+        # similar pairs keep their row-major order through a stable sort
+        found.sort(key=lambda x: (x[0], x[1]))
+
+        self.distance_totals = totals
+        return found
+
     def find_confusable_pairs(self, threshold=0.15) -> List[Tuple]:
         """
         Find pairs of emoji that are too similar (confusable)
 
+        The same pass also totals the distances that
+        calculate_distinctiveness_scores needs, so calling it afterwards
+        costs no further pairwise work
+
         Args:
             threshold: Similarity threshold (0-1, lower = more similar)
                       0.15 means hashes differ by ~10 bits out of 64
@@ -259,33 +611,13 @@ class EmojiSimilarityAnalyzer:
         """
         print(f"\nFinding confusable pairs (threshold={threshold})...")
 
-        confusable_pairs = []
-        emoji_list = list(self.hashes.keys())
+        emoji_list = self.hash_ids
 
         total_comparisons = len(emoji_list) * (len(emoji_list) - 1) // 2
-        comparisons = 0
+        print(f"  Comparisons: {total_comparisons}")
 
-        for i, emoji1 in enumerate(emoji_list):
-            for emoji2 in emoji_list[i+1:]:
-                comparisons += 1
-
-                if comparisons % 10000 == 0:
-                    print(f"  Comparisons: {comparisons}/{total_comparisons} ({100*comparisons//total_comparisons}%)")
-
-                # Calculate average similarity across all hash types
-                similarities = []
-                for hash_type in ['dhash', 'phash', 'ahash', 'whash']:
-                    sim = self.calculate_hash_similarity(
-                        self.hashes[emoji1][hash_type],
-                        self.hashes[emoji2][hash_type]
-                    )
-                    similarities.append(sim)
-
-                avg_similarity = np.mean(similarities)
-
-                # If too similar, it's confusable
-                if avg_similarity < threshold:
-                    confusable_pairs.append((emoji1, emoji2, avg_similarity))
+        found = self._sweep_hash_distances(threshold)
+        confusable_pairs = [(emoji_list[i], emoji_list[j], sim) for i, j, sim in found]
 
         # Sort by similarity (most similar first)
         confusable_pairs.sort(key=lambda x: x[2])
@@ -304,33 +636,18 @@ class EmojiSimilarityAnalyzer:
         """
         print("\nCalculating distinctiveness scores...")
 
-        scores = {}
-        emoji_list = list(self.hashes.keys())
-
-        for i, emoji1 in enumerate(emoji_list):
-            if i % 100 == 0:
-                print(f"  Processed {i}/{len(emoji_list)}")
-
-            similarities = []
-
-            for emoji2 in emoji_list:
-                if emoji1 == emoji2:
-                    continue
-
-                # Average similarity across hash types
-                sims = []
-                for hash_type in ['dhash', 'phash', 'ahash', 'whash']:
-                    sim = self.calculate_hash_similarity(
-                        self.hashes[emoji1][hash_type],
-                        self.hashes[emoji2][hash_type]
-                    )
-                    sims.append(sim)
+        emoji_list = self.hash_ids
+        scale = 64.0 * len(HASH_TYPES)
 
-                similarities.append(np.mean(sims))
+        # Reuse the totals from find_confusable_pairs when it already ran
+        # on these hashes
+        if self.distance_totals is None:
+            self._sweep_hash_distances()
 
-            # Average similarity to all others
-            # Lower score = more distinct
-            scores[emoji1] = np.mean(similarities)
+        # Average similarity to all others (self-distance is 0)
+        # Lower score = more distinct
+        means = self.distance_totals / scale / (len(emoji_list) - 1)
+        scores = dict(zip(emoji_list, means.tolist()))
 
         print(f"✅ Calculated distinctiveness for {len(scores)} emoji")
 
@@ -405,8 +722,9 @@ def main():
     # Step 3: Compute perceptual hashes
     print("\n[STEP 3] Computing perceptual hashes...")
     # Only analyze emoji we have images for
+    existing = analyzer.existing_image_names()
     available_emoji = [e for e in filtered_emoji[:test_size]
-                      if (analyzer.images_dir / f"{e['codepoint'].replace(' ', '-').lower()}_{e['name'].replace('/', '-').replace(' ', '_')}.png").exists()]
+                      if analyzer._get_emoji_filepath(e).name in existing]
 
     print(f"Analyzing {len(available_emoji)} emoji with downloaded images...")
     hashes = analyzer.compute_perceptual_hashes(available_emoji)